@@ -13,9 +13,39 @@ This layer supports both:
 
 import os
 import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
 from enum import Enum
 
+logger = logging.getLogger("ethani.blockchain")
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# Import web3 once at module load (~30-80 ms) instead of inside each call,
+# so the cost is paid at startup rather than on the first pricing request
+try:
+    from web3 import Web3
+    from eth_abi import decode as abi_decode, encode as abi_encode
+except ImportError:
+    Web3 = None
+    abi_decode = None
+    abi_encode = None
+
+# Async twin (needs aiohttp); lets async FastAPI endpoints fan out many
+# concurrent pricing calls without blocking the event loop
+try:
+    from web3 import AsyncWeb3, AsyncHTTPProvider
+except ImportError:
+    AsyncWeb3 = None
+    AsyncHTTPProvider = None
+
 # Contract ABIs (minimal - just what we need)
 ETHANI_PRICING_ABI = [
     {
@@ -53,6 +83,121 @@ ETHANI_REGION_ABI = [
     }
 ]
 
+# Tier lookup tables for the mock/fallback pricing path. Ratios are held as
+# integer basis points (demand * 10000 // supply) and multipliers as basis
+# points, mirroring the contract's fixed-point math, so tier selection is a
+# single bisect instead of a float if/elif ladder. Each entry in the bounds
+# tuple is the highest ratio (in bps) still inside that tier.
+MOCK_TIER_UPPER_BOUNDS_BPS = (7999, 11000, 13000)
+MOCK_TIER_MULTIPLIERS_BPS = (9000, 10000, 10800, 11500)
+MOCK_TIER_REASONS = (
+    "Surplus (ratio < 0.80)",
+    "Balanced (0.80-1.10)",
+    "Shortage (ratio > 1.10)",
+    "Critical shortage (ratio > 1.30)",
+)
+
+# Region-name normalization: one translate pass instead of two string
+# allocations, memoized since the set of live region names is tiny
+_REGION_TRANS = str.maketrans(" ", "_")
+
+
+def ratio_bps_to_float(ratio_bps: int) -> float:
+    """Convert an audit-trail basis-point ratio to a display float (11000 -> 1.1)."""
+    return ratio_bps / 10000
+
+
+@lru_cache(maxsize=64)
+def _normalize_region(region: str) -> str:
+    """Normalize a region name to its lookup key ("Minahasa Selatan" -> "minahasa_selatan")."""
+    return region.translate(_REGION_TRANS).lower()
+
+
+# Pre-built fallback response templates, one per known failure reason.
+# _fallback_to_base_price runs on every degraded-RPC request, so the
+# static keys are built once here and only the price fields get patched.
+_FALLBACK_TEMPLATES = {
+    reason: {
+        "final_price": 0,
+        "reason": reason,
+        "source": "fallback",
+        "is_capped": False,
+    }
+    for reason in (
+        "CONTRACT_UNAVAILABLE",
+        "BLOCKCHAIN_UNAVAILABLE",
+        "CONTRACT_CALL_FAILED",
+        "STYLUS_CALL_FAILED",
+        "INSUFFICIENT_DATA",
+    )
+}
+
+
+# Canonical Multicall3 (same address on all chains, incl. Arbitrum Sepolia)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "name": "aggregate",
+        "type": "function",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"}
+                ]
+            }
+        ],
+        "outputs": [
+            {"name": "blockNumber", "type": "uint256"},
+            {"name": "returnData", "type": "bytes[]"}
+        ],
+        "stateMutability": "view"
+    }
+]
+
+# calculatePrice ABI shared by the deployed Solidity and Stylus contracts
+# (identical interface; Stylus is the WASM build). Parsed once at import so
+# contract objects never rebuild it per call.
+PRICING_CALL_ABI = [
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "supply", "type": "uint256"},
+            {"internalType": "uint256", "name": "demand", "type": "uint256"},
+            {"internalType": "uint256", "name": "basePrice", "type": "uint256"}
+        ],
+        "name": "calculatePrice",
+        "outputs": [
+            {"internalType": "uint256", "name": "finalPrice", "type": "uint256"},
+            {"internalType": "string", "name": "reason", "type": "string"},
+            {"internalType": "string", "name": "tier", "type": "string"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+
+def _classify_rpc_error(exc: Exception) -> str:
+    """
+    Map an exception from an eth_call to a fallback reason.
+
+    Transport problems (connection refused, DNS, timeouts) mean the
+    blockchain is unreachable; anything else is a failed contract call.
+    With no is_connected() pre-probe on the hot path, this keeps the two
+    failure modes distinguishable in the fallback audit trail.
+    """
+    import requests as _requests
+    if isinstance(exc, (_requests.exceptions.ConnectionError,
+                        _requests.exceptions.Timeout,
+                        ConnectionError,
+                        TimeoutError,
+                        OSError)):
+        return "BLOCKCHAIN_UNAVAILABLE"
+    return "CONTRACT_CALL_FAILED"
+
 
 class BlockchainMode(Enum):
     """Blockchain operation mode"""
@@ -126,15 +271,175 @@ class ContractIntegration:
         
         # If real mode requested but contracts not deployed, fallback to mock
         if mode == BlockchainMode.REAL and not self.contracts_available:
-            print("⚠️  Real mode requested but contracts not deployed. Using MOCK mode.")
+            logger.warning("real mode requested but contracts not deployed; using mock mode")
             self.mode = BlockchainMode.MOCK
-        
+
+        # Short TTL caches: identical pricing/base-price queries within the
+        # TTL skip the RPC round-trip entirely. The TTL approximates a
+        # block window - contract pricing only changes on governance
+        # events, so a result is valid for at least the window without
+        # spending an extra eth_blockNumber poll per refresh. Inputs
+        # change on the order of minutes, bursts arrive in milliseconds.
+        self.cache_ttl = int(os.getenv("BLOCKCHAIN_CACHE_TTL", "5"))
+        if TTLCache is not None:
+            self._price_cache = TTLCache(maxsize=4096, ttl=self.cache_ttl)
+            self._base_price_cache = TTLCache(maxsize=256, ttl=self.cache_ttl)
+        else:
+            self._price_cache = None
+            self._base_price_cache = None
+
+        # Stylus circuit breaker: repeated Stylus failures within a short
+        # window skip straight to Solidity instead of retrying (and
+        # doubling RPC traffic) on every request
+        self._stylus_fail_count = 0
+        self._stylus_fail_window_start = 0.0
+        self._stylus_open_until = 0.0
+
+        # Web3 instance + contract objects, built once so each pricing
+        # request is a single eth_call round-trip (no per-call Web3/ABI setup)
+        self._w3 = None
+        self._session = None
+        self._pricing_addr_cs = None
+        self._stylus_addr_cs = None
+        self._region_addr_cs = None
+        self._pricing_contract = None
+        self._stylus_pricing_contract = None
+        self._region_contract = None
+        self._multicall_contract = None
+        self._aw3 = None
+        self._apricing_contract = None
+        self._astylus_pricing_contract = None
+        self._acalc_price_fn = None
+        self._astylus_calc_price_fn = None
+        self._get_base_price_fn = None
+        self._calc_price_fn = None
+        self._aggregate_fn = None
+
+        if self.mode == BlockchainMode.REAL:
+            self._init_web3()
+
         # Log contract configuration
         if self.mode == BlockchainMode.REAL:
-            print(f"✅ Hybrid Contract Mode Enabled")
-            print(f"  Pricing: {'Stylus' if self.use_stylus_pricing else 'Solidity'}")
-            print(f"  Regions: {'Stylus' if self.use_stylus_regions else 'Solidity'}")
+            logger.info(
+                "hybrid contract mode enabled: pricing=%s regions=%s",
+                "stylus" if self.use_stylus_pricing else "solidity",
+                "stylus" if self.use_stylus_regions else "solidity",
+            )
+
+    def _init_web3(self):
+        """
+        Build the Web3 instance and contract objects once.
+
+        Checksummed addresses and ABI parsing are paid here instead of on
+        every calculate_price call. If web3 is missing or the provider
+        can't be constructed, contract calls fall back to base price.
+        """
+        if Web3 is None:
+            logger.warning("web3 not installed - contract calls will use fallback")
+            return
+
+        try:
+            # Pooled keep-alive session: without it web3's HTTPProvider opens
+            # a fresh TCP+TLS connection per RPC, and the handshake dominates
+            # eth_call latency on Arbitrum Sepolia
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+
+            self._w3 = Web3(Web3.HTTPProvider(
+                self.rpc_url,
+                session=session,
+                request_kwargs={"timeout": 5}
+            ))
+            self._slim_middleware_stack(self._w3)
+
+            if self.pricing_contract_address:
+                self._pricing_addr_cs = self._w3.to_checksum_address(self.pricing_contract_address)
+                self._pricing_contract = self._w3.eth.contract(
+                    address=self._pricing_addr_cs, abi=PRICING_CALL_ABI
+                )
+
+            if self.pricing_stylus_address:
+                self._stylus_addr_cs = self._w3.to_checksum_address(self.pricing_stylus_address)
+                self._stylus_pricing_contract = self._w3.eth.contract(
+                    address=self._stylus_addr_cs, abi=PRICING_CALL_ABI
+                )
+
+            if self.region_contract_address:
+                self._region_addr_cs = self._w3.to_checksum_address(self.region_contract_address)
+                self._region_contract = self._w3.eth.contract(
+                    address=self._region_addr_cs, abi=ETHANI_REGION_ABI
+                )
+
+            self._multicall_contract = self._w3.eth.contract(
+                address=self._w3.to_checksum_address(MULTICALL3_ADDRESS),
+                abi=MULTICALL3_ABI
+            )
+
+            # Resolve each contract function once: contract.functions.X
+            # re-scans the ABI list on every access, so the non-raw call
+            # sites (batching, multicall, async) bind these instead
+            if self._pricing_contract is not None:
+                self._calc_price_fn = \
+                    self._pricing_contract.get_function_by_name("calculatePrice")
+            if self._region_contract is not None:
+                self._get_base_price_fn = \
+                    self._region_contract.get_function_by_name("getBasePrice")
+            self._aggregate_fn = self._multicall_contract.get_function_by_name("aggregate")
+
+            # Pre-hashed calculatePrice selector + output types: the hot
+            # path builds raw calldata and decodes with eth_abi directly,
+            # skipping web3's per-call ABI lookup/dispatch machinery
+            self._pricing_selector = Web3.keccak(
+                text="calculatePrice(uint256,uint256,uint256)"
+            )[:4]
+            self._pricing_in_types = ("uint256", "uint256", "uint256")
+            self._pricing_out_types = ("uint256", "string", "string")
+
+            # Async provider + contracts (same addresses/ABI); skipped when
+            # aiohttp isn't installed - sync path still works
+            if AsyncWeb3 is not None:
+                self._aw3 = AsyncWeb3(AsyncHTTPProvider(
+                    self.rpc_url, request_kwargs={"timeout": 5}
+                ))
+                self._slim_middleware_stack(self._aw3)
+                if self._pricing_addr_cs:
+                    self._apricing_contract = self._aw3.eth.contract(
+                        address=self._pricing_addr_cs, abi=PRICING_CALL_ABI
+                    )
+                    self._acalc_price_fn = \
+                        self._apricing_contract.get_function_by_name("calculatePrice")
+                if self._stylus_addr_cs:
+                    self._astylus_pricing_contract = self._aw3.eth.contract(
+                        address=self._stylus_addr_cs, abi=PRICING_CALL_ABI
+                    )
+                    self._astylus_calc_price_fn = \
+                        self._astylus_pricing_contract.get_function_by_name("calculatePrice")
+        except Exception as e:
+            logger.warning("web3 init failed: %s", e)
+            self._w3 = None
     
+    @staticmethod
+    def _slim_middleware_stack(w3) -> None:
+        """
+        Strip middlewares that only matter for transactions.
+
+        Our workload is read-only eth_call against pre-checksummed
+        addresses, so gas price strategy, gas estimation, and ENS name
+        resolution are dead weight run on every request. Removal is
+        best-effort: names vary across web3 versions.
+        """
+        for name in ("gas_price_strategy", "gas_estimate", "ens_name_to_address"):
+            try:
+                w3.middleware_onion.remove(name)
+            except (KeyError, ValueError):
+                pass
+
     def calculate_price(
         self,
         supply: int,
@@ -162,21 +467,247 @@ class ContractIntegration:
         Returns:
             Dict with: final_price, reason, source (contract or local)
         """
-        
+
+        cache_key = (supply, demand, base_price, region, self.mode)
+        if self._price_cache is not None:
+            cached = self._price_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         if self.mode == BlockchainMode.REAL and self.contracts_available:
             try:
-                # Try Stylus first (faster), fallback to Solidity
-                if self.use_stylus_pricing:
-                    return self._call_stylus_pricing_contract(supply, demand, base_price, region)
+                # Try Stylus first (faster), fallback to Solidity;
+                # skip Stylus entirely while its circuit breaker is open
+                if self.use_stylus_pricing and not self._stylus_circuit_open():
+                    result = self._call_stylus_pricing_contract(supply, demand, base_price, region)
                 else:
-                    return self._call_pricing_contract(supply, demand, base_price, region)
+                    result = self._call_pricing_contract(supply, demand, base_price, region)
             except Exception as e:
-                print(f"❌ Contract call failed: {e}")
+                logger.exception("contract call failed")
                 return self._fallback_to_base_price(base_price, "CONTRACT_UNAVAILABLE")
-        
+
+        else:  # MOCK mode
+            result = self._mock_pricing_calculation(supply, demand, base_price, region)
+
+        # Don't cache fallbacks - a recovered RPC should be retried promptly
+        if self._price_cache is not None and result.get("source") != "fallback":
+            self._price_cache[cache_key] = result
+
+        return result
+
+    def invalidate(self):
+        """Clear the TTL caches (used by tests and on config changes)."""
+        if self._price_cache is not None:
+            self._price_cache.clear()
+        if self._base_price_cache is not None:
+            self._base_price_cache.clear()
+
+    async def acalculate_price(
+        self,
+        supply: int,
+        demand: int,
+        base_price: int,
+        region: str = "Default"
+    ) -> Dict:
+        """
+        Async variant of calculate_price using AsyncWeb3.
+
+        A blocking eth_call stalls a FastAPI worker for a full RTT; this
+        awaits the RPC instead so one worker can multiplex many in-flight
+        pricing calls. Shares the TTL cache and fallback behavior with
+        the sync path.
+        """
+
+        cache_key = (supply, demand, base_price, region, self.mode)
+        if self._price_cache is not None:
+            cached = self._price_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if self.mode == BlockchainMode.REAL and self.contracts_available:
+            # Same Stylus -> Solidity -> base chain as the sync path,
+            # sharing its circuit breaker state
+            if (self.use_stylus_pricing
+                    and self._astylus_calc_price_fn is not None
+                    and not self._stylus_circuit_open()):
+                result = await self._acall_stylus_pricing_contract(
+                    supply, demand, base_price, region
+                )
+            else:
+                result = await self._acall_pricing_contract(
+                    supply, demand, base_price, region
+                )
         else:  # MOCK mode
-            return self._mock_pricing_calculation(supply, demand, base_price, region)
+            result = self._mock_pricing_calculation(supply, demand, base_price, region)
+
+        if self._price_cache is not None and result.get("source") != "fallback":
+            self._price_cache[cache_key] = result
+
+        return result
+
+    async def _acall_pricing_contract(
+        self,
+        supply: int,
+        demand: int,
+        base_price: int,
+        region: str
+    ) -> Dict:
+        """Async counterpart of _call_pricing_contract (Solidity)."""
+        if self._acalc_price_fn is None:
+            return self._fallback_to_base_price(base_price, "BLOCKCHAIN_UNAVAILABLE")
+        try:
+            final_price, reason_str, tier = await self._acalc_price_fn(
+                supply, demand, base_price
+            ).call()
+            return {
+                "final_price": final_price,
+                "reason": f"{reason_str} [{tier}]",
+                "source": "smart_contract_solidity",
+                "contract_address": self._apricing_contract.address,
+                "contract_type": "solidity",
+                "ai_used": False
+            }
+        except Exception as e:
+            logger.exception("async solidity contract call failed")
+            return self._fallback_to_base_price(base_price, _classify_rpc_error(e))
+
+    async def _acall_stylus_pricing_contract(
+        self,
+        supply: int,
+        demand: int,
+        base_price: int,
+        region: str
+    ) -> Dict:
+        """Async counterpart of _call_stylus_pricing_contract (WASM)."""
+        try:
+            final_price, reason_str, tier = await self._astylus_calc_price_fn(
+                supply, demand, base_price
+            ).call()
+
+            # Healthy again: close the circuit
+            self._stylus_fail_count = 0
+            self._stylus_open_until = 0.0
+
+            return {
+                "final_price": final_price,
+                "reason": f"{reason_str} [{tier}]",
+                "source": "smart_contract_stylus",
+                "contract_address": self._astylus_pricing_contract.address,
+                "contract_type": "stylus_wasm",
+                "ai_used": False,
+                "execution_type": "WASM"
+            }
+        except Exception:
+            logger.exception("async stylus contract call failed")
+            self._record_stylus_failure()
+            # Fallback to Solidity version
+            if self.pricing_contract_address:
+                return await self._acall_pricing_contract(
+                    supply, demand, base_price, region
+                )
+            else:
+                return self._fallback_to_base_price(base_price, "STYLUS_CALL_FAILED")
     
+    def calculate_price_with_base(
+        self,
+        supply: int,
+        demand: int,
+        base_price: int,
+        region: str = "Default"
+    ) -> Dict:
+        """
+        Fetch the region base price AND calculate the price in a single
+        JSON-RPC batch (one HTTP POST instead of two sequential eth_calls).
+
+        Each sequential eth_call pays a full round-trip to Arbitrum
+        Sepolia; batching collapses the two reads into one RTT.
+
+        Args:
+            supply: Food supply units
+            demand: Food demand units
+            base_price: Base/reference price passed to calculatePrice
+            region: Region name (mapped to on-chain region id)
+
+        Returns:
+            Same dict as calculate_price, plus "onchain_base_price" when
+            the region contract read succeeds.
+        """
+
+        if (self.mode == BlockchainMode.REAL
+                and self._w3 is not None
+                and self._pricing_contract is not None
+                and self._region_contract is not None):
+            try:
+                with self._w3.batch_requests() as batch:
+                    batch.add(self._get_base_price_fn(self._region_id(region)))
+                    batch.add(self._calc_price_fn(supply, demand, base_price))
+                    onchain_base, pricing = batch.execute()
+
+                final_price, reason_str, tier = pricing
+
+                return {
+                    "final_price": final_price,
+                    "reason": f"{reason_str} [{tier}]",
+                    "source": "smart_contract_batched",
+                    "contract_address": self._pricing_addr_cs,
+                    "onchain_base_price": onchain_base,
+                    "ai_used": False
+                }
+            except Exception as e:
+                logger.exception("batched contract call failed")
+                # Fall through to the single-call path
+
+        result = self.calculate_price(supply, demand, base_price, region)
+        result["onchain_base_price"] = None
+        return result
+
+    def _region_id(self, region: str) -> int:
+        """Map a region name to its on-chain region id (0 = default)."""
+        region_ids = {
+            "default": 0,
+            "minahasa_selatan": 1,
+            "java": 2,
+            "sumatra": 3,
+        }
+        return region_ids.get(_normalize_region(region), 0)
+
+    def _stylus_circuit_open(self) -> bool:
+        """True while the Stylus circuit breaker is open."""
+        return time.monotonic() < self._stylus_open_until
+
+    def _record_stylus_failure(self):
+        """Count a Stylus failure; 3 failures within 10s open the circuit for 30s."""
+        now = time.monotonic()
+        if now - self._stylus_fail_window_start > 10.0:
+            self._stylus_fail_window_start = now
+            self._stylus_fail_count = 0
+        self._stylus_fail_count += 1
+        if self._stylus_fail_count >= 3:
+            self._stylus_open_until = now + 30.0
+            self._stylus_fail_count = 0
+            logger.warning("stylus circuit opened for 30s after repeated failures")
+
+    def _raw_eth_call(self, to_addr: str, calldata: bytes) -> bytes:
+        """
+        Issue eth_call as a raw JSON-RPC POST over the pooled session.
+
+        Bypasses web3's per-call middleware stack entirely; pinned to
+        block_identifier "latest" explicitly. Returns the raw ABI-encoded
+        result bytes (decode with eth_abi).
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "eth_call",
+            "params": [{"to": to_addr, "data": "0x" + calldata.hex()}, "latest"],
+            "id": 1,
+        }
+        response = self._session.post(self.rpc_url, json=payload, timeout=5)
+        response.raise_for_status()
+        body = response.json()
+        if "error" in body:
+            raise ValueError(f"eth_call failed: {body['error']}")
+        return bytes.fromhex(body["result"][2:])
+
     def _call_pricing_contract(
         self,
         supply: int,
@@ -193,55 +724,35 @@ class ContractIntegration:
         Returns result exactly as contract provides it.
         """
         try:
-            from web3 import Web3
-            
-            # Initialize web3 connection to Arbitrum Sepolia
-            w3 = Web3(Web3.HTTPProvider(self.rpc_url))
-            
-            # Check connection
-            if not w3.is_connected():
+            if self._pricing_contract is None:
                 return self._fallback_to_base_price(base_price, "BLOCKCHAIN_UNAVAILABLE")
-            
-            # Contract ABI (minimal - just calculatePrice)
-            abi = [
-                {
-                    "inputs": [
-                        {"internalType": "uint256", "name": "supply", "type": "uint256"},
-                        {"internalType": "uint256", "name": "demand", "type": "uint256"},
-                        {"internalType": "uint256", "name": "basePrice", "type": "uint256"}
-                    ],
-                    "name": "calculatePrice",
-                    "outputs": [
-                        {"internalType": "uint256", "name": "finalPrice", "type": "uint256"},
-                        {"internalType": "string", "name": "reason", "type": "string"},
-                        {"internalType": "string", "name": "tier", "type": "string"}
-                    ],
-                    "stateMutability": "pure",
-                    "type": "function"
-                }
-            ]
-            
-            # Connect to contract on Arbitrum Sepolia
-            contract = w3.eth.contract(address=w3.to_checksum_address(self.pricing_contract_address), abi=abi)
-            
-            # Call calculatePrice function (pure function, no gas cost)
-            result = contract.functions.calculatePrice(supply, demand, base_price).call()
-            
+
+            # Raw eth_call with pre-hashed selector (pure function, no gas
+            # cost). All three args are static uint256, so calldata is
+            # three big-endian words - no ABI codec needed on the way in.
+            # Connection errors surface here and hit the except below -
+            # no separate is_connected() probe (an extra RPC)
+            calldata = (self._pricing_selector
+                        + supply.to_bytes(32, "big")
+                        + demand.to_bytes(32, "big")
+                        + base_price.to_bytes(32, "big"))
+            raw = self._raw_eth_call(self._pricing_addr_cs, calldata)
+
             # Unpack result: (finalPrice, reason, tier)
-            final_price, reason_str, tier = result
+            final_price, reason_str, tier = abi_decode(self._pricing_out_types, raw)
             
             return {
                 "final_price": final_price,
                 "reason": f"{reason_str} [{tier}]",
                 "source": "smart_contract_solidity",
-                "contract_address": self.pricing_contract_address,
+                "contract_address": self._pricing_addr_cs,
                 "contract_type": "solidity",
                 "ai_used": False
             }
             
         except Exception as e:
-            print(f"❌ Solidity contract call failed: {e}")
-            return self._fallback_to_base_price(base_price, "CONTRACT_CALL_FAILED")
+            logger.exception("solidity contract call failed")
+            return self._fallback_to_base_price(base_price, _classify_rpc_error(e))
     
     def _call_stylus_pricing_contract(
         self,
@@ -259,55 +770,37 @@ class ContractIntegration:
         Returns result exactly as contract provides it.
         """
         try:
-            from web3 import Web3
-            
-            # Initialize web3 connection
-            w3 = Web3(Web3.HTTPProvider(self.rpc_url))
-            
-            # Check connection
-            if not w3.is_connected():
+            if self._stylus_pricing_contract is None:
                 return self._fallback_to_base_price(base_price, "BLOCKCHAIN_UNAVAILABLE")
-            
-            # Stylus contract ABI (same interface as Solidity version)
-            abi = [
-                {
-                    "inputs": [
-                        {"internalType": "uint256", "name": "supply", "type": "uint256"},
-                        {"internalType": "uint256", "name": "demand", "type": "uint256"},
-                        {"internalType": "uint256", "name": "basePrice", "type": "uint256"}
-                    ],
-                    "name": "calculatePrice",
-                    "outputs": [
-                        {"internalType": "uint256", "name": "finalPrice", "type": "uint256"},
-                        {"internalType": "string", "name": "reason", "type": "string"},
-                        {"internalType": "string", "name": "tier", "type": "string"}
-                    ],
-                    "stateMutability": "view",
-                    "type": "function"
-                }
-            ]
-            
-            # Connect to Stylus contract (WASM)
-            contract = w3.eth.contract(address=w3.to_checksum_address(self.pricing_stylus_address), abi=abi)
-            
-            # Call calculatePrice function (WASM execution - much faster!)
-            result = contract.functions.calculatePrice(supply, demand, base_price).call()
-            
+
+            # Raw eth_call with the shared pre-hashed selector (same
+            # interface as Solidity; WASM execution - much faster!)
+            calldata = (self._pricing_selector
+                        + supply.to_bytes(32, "big")
+                        + demand.to_bytes(32, "big")
+                        + base_price.to_bytes(32, "big"))
+            raw = self._raw_eth_call(self._stylus_addr_cs, calldata)
+
             # Unpack result: (finalPrice, reason, tier)
-            final_price, reason_str, tier = result
-            
+            final_price, reason_str, tier = abi_decode(self._pricing_out_types, raw)
+
+            # Healthy again: close the circuit
+            self._stylus_fail_count = 0
+            self._stylus_open_until = 0.0
+
             return {
                 "final_price": final_price,
                 "reason": f"{reason_str} [{tier}]",
                 "source": "smart_contract_stylus",
-                "contract_address": self.pricing_stylus_address,
+                "contract_address": self._stylus_addr_cs,
                 "contract_type": "stylus_wasm",
                 "ai_used": False,
                 "execution_type": "WASM"
             }
             
         except Exception as e:
-            print(f"❌ Stylus contract call failed: {e}")
+            logger.exception("stylus contract call failed")
+            self._record_stylus_failure()
             # Fallback to Solidity version
             if self.pricing_contract_address:
                 return self._call_pricing_contract(supply, demand, base_price, region)
@@ -319,70 +812,82 @@ class ContractIntegration:
         supply: int,
         demand: int,
         base_price: int,
-        region: str
+        region: str,
+        detailed: bool = True
     ) -> Dict:
         """
         Mock pricing calculation.
         Uses same logic as smart contract for consistency.
-        
+
         This mimics EthaniPricing.sol logic exactly.
+
+        Args:
+            detailed: Include the audit breakdown (batch callers that only
+                need the price can pass False to skip the dict build)
         """
-        
+
         # Validate
-        if supply <= 0:
+        if supply <= 0 or demand < 0:
             return self._fallback_to_base_price(base_price, "INSUFFICIENT_DATA")
-        
-        if demand < 0:
-            return self._fallback_to_base_price(base_price, "INSUFFICIENT_DATA")
-        
-        # Calculate ratio
-        ratio = demand / supply
-        
-        # Determine multiplier (MUST match contract)
-        if ratio > 1.30:
-            multiplier = 1.15
-            tier_reason = "Critical shortage (ratio > 1.30)"
-        elif ratio > 1.10:
-            multiplier = 1.08
-            tier_reason = "Shortage (ratio > 1.10)"
-        elif ratio < 0.80:
-            multiplier = 0.90
-            tier_reason = "Surplus (ratio < 0.80)"
-        else:
-            multiplier = 1.0
-            tier_reason = "Balanced (0.80-1.10)"
-        
-        # Apply multiplier
-        calculated_price = int(base_price * multiplier)
-        
-        # Apply hard limits (MUST match contract)
-        max_allowed = int(base_price * 1.50)  # +50%
-        min_allowed = int(base_price * 0.70)  # -30%
-        
-        is_capped = False
-        if calculated_price > max_allowed:
-            calculated_price = max_allowed
-            tier_reason += " [CAPPED +50%]"
-            is_capped = True
-        elif calculated_price < min_allowed:
-            calculated_price = min_allowed
-            tier_reason += " [FLOORED -30%]"
-            is_capped = True
-        
-        return {
-            "final_price": calculated_price,
+
+        # Integer ratio in basis points; floor division matches the
+        # contract's fixed-point arithmetic (no Python float on this path)
+        ratio_bps = (demand * 10000) // supply
+
+        # Balanced market is the common case in steady traffic: the price
+        # is just the base price, so skip the multiplier/clamp work
+        if 8000 <= ratio_bps <= 11000:
+            result = {
+                "final_price": base_price,
+                "reason": MOCK_TIER_REASONS[1],
+                "source": "mock_pricing" if self.mode == BlockchainMode.MOCK else "smart_contract",
+                "is_capped": False,
+            }
+            if detailed:
+                result["audit"] = {
+                    "supply": supply,
+                    "demand": demand,
+                    "ratio_bps": ratio_bps,
+                    "multiplier": 1.0,
+                    "base_price": base_price,
+                    "calculated_price": base_price
+                }
+            return result
+
+        # Tier selection: one bisect against the sorted bounds table
+        # (MUST match contract)
+        idx = bisect_left(MOCK_TIER_UPPER_BOUNDS_BPS, ratio_bps)
+        multiplier_bps = MOCK_TIER_MULTIPLIERS_BPS[idx]
+        tier_reason = MOCK_TIER_REASONS[idx]
+
+        # Apply multiplier in basis points
+        calculated_price = (base_price * multiplier_bps) // 10000
+
+        # Apply hard limits (MUST match contract) - single clamp expression
+        max_allowed = (base_price * 15000) // 10000  # +50%
+        min_allowed = (base_price * 7000) // 10000   # -30%
+        final_price = max(min_allowed, min(calculated_price, max_allowed))
+
+        is_capped = final_price != calculated_price
+        if is_capped:
+            tier_reason += " [CAPPED +50%]" if final_price == max_allowed else " [FLOORED -30%]"
+
+        result = {
+            "final_price": final_price,
             "reason": tier_reason,
             "source": "mock_pricing" if self.mode == BlockchainMode.MOCK else "smart_contract",
             "is_capped": is_capped,
-            "audit": {
+        }
+        if detailed:
+            result["audit"] = {
                 "supply": supply,
                 "demand": demand,
-                "ratio": round(ratio, 2),
-                "multiplier": multiplier,
+                "ratio_bps": ratio_bps,
+                "multiplier": multiplier_bps / 10000,
                 "base_price": base_price,
-                "calculated_price": calculated_price
+                "calculated_price": final_price
             }
-        }
+        return result
     
     def _fallback_to_base_price(
         self,
@@ -396,16 +901,16 @@ class ContractIntegration:
         - Smart contract failure → fallback to base price
         - Missing data → fallback to base price
         """
-        return {
-            "final_price": base_price,
-            "reason": reason,
-            "source": "fallback",
-            "is_capped": False,
-            "audit": {
-                "fallback_reason": reason,
-                "base_price": base_price
-            }
+        template = _FALLBACK_TEMPLATES.get(reason)
+        if template is None:
+            template = {"reason": reason, "source": "fallback", "is_capped": False}
+        result = template.copy()
+        result["final_price"] = base_price
+        result["audit"] = {
+            "fallback_reason": reason,
+            "base_price": base_price
         }
+        return result
     
     def get_base_price(self, region: str) -> int:
         """
@@ -414,17 +919,67 @@ class ContractIntegration:
         Per Spec Section III:
         Backend must "Fetch base price from contracts"
         """
-        
+
+        cache_key = region.lower().strip()
+        if self._base_price_cache is not None:
+            cached = self._base_price_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         if self.mode == BlockchainMode.REAL and self.contracts_available:
             try:
-                return self._call_region_contract_get_base_price(region)
+                price = self._call_region_contract_get_base_price(region)
             except Exception as e:
-                print(f"❌ Contract call failed: {e}")
-                return self._mock_base_price(region)
-        
+                logger.exception("region contract call failed")
+                price = self._mock_base_price(region)
+
         else:  # MOCK mode
-            return self._mock_base_price(region)
+            price = self._mock_base_price(region)
+
+        if self._base_price_cache is not None:
+            self._base_price_cache[cache_key] = price
+
+        return price
     
+    def get_base_prices_bulk(self, regions: list) -> Dict:
+        """
+        Fetch base prices for many regions in ONE eth_call via Multicall3.
+
+        N sequential getBasePrice reads cost N round-trips (and some RPC
+        providers meter or reject large JSON-RPC batches); Multicall3
+        aggregates them on-chain so the whole fan-out is a single call.
+
+        Args:
+            regions: Region names
+
+        Returns:
+            Dict mapping region name -> base price
+        """
+
+        if (self.mode == BlockchainMode.REAL
+                and self._multicall_contract is not None
+                and self._region_contract is not None):
+            try:
+                calls = [
+                    (
+                        self._region_addr_cs,
+                        self._region_contract.encode_abi("getBasePrice", args=[self._region_id(r)])
+                    )
+                    for r in regions
+                ]
+
+                _block, return_data = self._aggregate_fn(calls).call()
+
+                return {
+                    region: abi_decode(["uint256"], raw)[0]
+                    for region, raw in zip(regions, return_data)
+                }
+            except Exception as e:
+                logger.exception("multicall failed")
+                # Fall through to per-region mock prices
+
+        return {region: self._mock_base_price(region) for region in regions}
+
     def _call_region_contract_get_base_price(self, region: str) -> int:
         """Call EthaniRegion.getBasePrice contract."""
         raise NotImplementedError(
@@ -442,8 +997,7 @@ class ContractIntegration:
             "sumatra": 10200,
         }
         
-        region_key = region.lower().replace(" ", "_")
-        return mock_prices.get(region_key, mock_prices["default"])
+        return mock_prices.get(_normalize_region(region), mock_prices["default"])
     
     def health_check(self) -> Dict:
         """Check blockchain integration health."""
@@ -457,11 +1011,39 @@ class ContractIntegration:
         }
 
 
-# Global contract instance (use REAL mode - contracts deployed on Arbitrum Sepolia)
-blockchain = ContractIntegration(mode=BlockchainMode.REAL)
+# Global contract instance, created lazily on first use so importing this
+# module (or just BlockchainMode) doesn't pay env reads, checksumming, and
+# the startup banner (use REAL mode - contracts deployed on Arbitrum Sepolia)
+_default_mode = BlockchainMode.REAL
+_blockchain: Optional[ContractIntegration] = None
+_blockchain_lock = threading.Lock()
+
+
+def get_blockchain() -> ContractIntegration:
+    """Return the shared ContractIntegration instance (built on first call)."""
+    global _blockchain
+    # Double-checked locking: the fast path is a single global read, the
+    # lock is only taken (once) while the instance is being constructed
+    if _blockchain is None:
+        with _blockchain_lock:
+            if _blockchain is None:
+                _blockchain = ContractIntegration(mode=_default_mode)
+    return _blockchain
 
 
 def update_blockchain_mode(mode: BlockchainMode):
     """Update global blockchain mode (for testing)."""
-    global blockchain
-    blockchain = ContractIntegration(mode=mode)
+    global _default_mode, _blockchain
+    with _blockchain_lock:
+        _default_mode = mode
+        _blockchain = None
+    globals().pop("blockchain", None)
+
+
+def __getattr__(name):
+    """Lazily build the module-level `blockchain` instance (PEP 562)."""
+    if name == "blockchain":
+        instance = get_blockchain()
+        globals()["blockchain"] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,243 @@
+"""
+ETHANI In-Process Cache Helpers
+
+TTL caching with single-flight coalescing for the blockchain layer:
+identical concurrent requests share one in-flight RPC instead of each
+paying a network round-trip, and results are served from memory for a
+short window afterwards (contract pricing is deterministic, so a
+30-second-old answer is still correct for identical inputs).
+"""
+
+import asyncio
+import functools
+import math
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import orjson
+
+try:
+    from cachetools import TTLCache
+except ImportError:  # pragma: no cover - cachetools is in requirements
+    TTLCache = None
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - redis is optional
+    aioredis = None
+
+
+class SingleFlightTTLCache:
+    """
+    TTL cache where concurrent misses for the same key are coalesced.
+
+    The first caller for a key runs the supplier; everyone else awaits
+    the same future. Entries expire after `ttl` seconds. Falls back to
+    a plain dict with manual expiry when cachetools is unavailable.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 30):
+        self.ttl = ttl
+        if TTLCache is not None:
+            self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+            self._expiry = None
+        else:
+            self._cache = {}
+            self._expiry: Optional[Dict[Hashable, float]] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if absent/expired."""
+        if self._expiry is not None:
+            deadline = self._expiry.get(key)
+            if deadline is not None and deadline < time.monotonic():
+                self._cache.pop(key, None)
+                self._expiry.pop(key, None)
+                return None
+        return self._cache.get(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._cache[key] = value
+        if self._expiry is not None:
+            self._expiry[key] = time.monotonic() + self.ttl
+
+    def clear(self) -> None:
+        self._cache.clear()
+        if self._expiry is not None:
+            self._expiry.clear()
+        self._inflight.clear()
+
+    async def get_or_create(
+        self,
+        key: Hashable,
+        supplier: Callable[[], Awaitable[Any]],
+        cache_result: Callable[[Any], bool] = lambda _: True
+    ) -> Any:
+        """
+        Return the cached value for key, computing it at most once.
+
+        Concurrent callers with the same key await a shared future
+        (single-flight) so a burst of identical requests costs one
+        supplier call. `cache_result` can veto storing a result (e.g.
+        fallback responses that should be retried promptly).
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await supplier()
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Consume the exception so an un-awaited future doesn't log
+            future.exception()
+            self._inflight.pop(key, None)
+            raise
+        else:
+            future.set_result(result)
+            if cache_result(result):
+                self.set(key, result)
+            self._inflight.pop(key, None)
+            return result
+
+
+def _is_live_result(result: Any) -> bool:
+    """Only cache real contract/mock answers, never fallback responses."""
+    return not (isinstance(result, dict) and result.get("source") == "fallback")
+
+
+# Shared cache for blockchain price lookups; TTL mirrors the blockchain
+# layer's own knob so both can be tuned with one env var
+blockchain_price_cache = SingleFlightTTLCache(
+    maxsize=10_000,
+    ttl=int(os.getenv("BLOCKCHAIN_CACHE_TTL", "30"))
+)
+
+
+async def cached_blockchain_price(
+    blockchain, supply: int, demand: int, base_price: int, region: str
+) -> dict:
+    """
+    Async blockchain price lookup with TTL + single-flight coalescing.
+
+    On a hit the RPC is skipped entirely; on a miss concurrent identical
+    requests share one acalculate_price call.
+    """
+    key = (supply, demand, base_price, region)
+    return await blockchain_price_cache.get_or_create(
+        key,
+        lambda: blockchain.acalculate_price(supply, demand, base_price, region),
+        cache_result=_is_live_result
+    )
+
+
+class ResponseCache:
+    """
+    Redis-backed cache for whole endpoint responses.
+
+    The endpoints it serves are deterministic functions of their inputs
+    (the rules doc guarantees same input = same output), so a cached
+    JSON payload is as correct as a recomputed one. Payloads are stored
+    as orjson bytes keyed by a caller-built string; prefixes allow
+    targeted invalidation when a write endpoint changes the data.
+
+    Redis is optional: when the redis package or REDIS_URL is missing,
+    or a Redis call fails, the cache degrades to an in-process dict
+    with the same semantics (minus cross-worker sharing).
+    """
+
+    def __init__(self, url: Optional[str] = None, maxsize: int = 10_000):
+        url = url if url is not None else os.getenv("REDIS_URL", "")
+        self._redis = (
+            aioredis.from_url(url) if aioredis is not None and url else None
+        )
+        self._maxsize = maxsize
+        # key -> (expiry deadline, payload bytes); math.inf = no expiry
+        self._local: Dict[str, tuple] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached payload for key, or None on miss/expiry."""
+        raw = None
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(key)
+            except Exception:
+                raw = None
+        if raw is None:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            deadline, raw = entry
+            if deadline < time.monotonic():
+                self._local.pop(key, None)
+                return None
+        return orjson.loads(raw)
+
+    async def set(self, key: str, payload: Any, ttl: Optional[float]) -> None:
+        """Store payload under key; ttl=None means no expiry."""
+        raw = orjson.dumps(payload)
+        if self._redis is not None:
+            try:
+                if ttl is None:
+                    await self._redis.set(key, raw)
+                else:
+                    await self._redis.setex(key, int(ttl), raw)
+                return
+            except Exception:
+                pass
+        if len(self._local) >= self._maxsize:
+            now = time.monotonic()
+            for k in [k for k, (d, _) in self._local.items() if d < now]:
+                self._local.pop(k, None)
+            if len(self._local) >= self._maxsize:
+                self._local.clear()
+        deadline = math.inf if ttl is None else time.monotonic() + ttl
+        self._local[key] = (deadline, raw)
+
+    async def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every cached entry whose key starts with prefix."""
+        if self._redis is not None:
+            try:
+                async for key in self._redis.scan_iter(match=prefix + "*"):
+                    await self._redis.delete(key)
+            except Exception:
+                pass
+        for key in [k for k in self._local if k.startswith(prefix)]:
+            self._local.pop(key, None)
+
+
+# Shared response cache for the deterministic read endpoints
+response_cache = ResponseCache()
+
+
+def cached_response(ttl: Optional[float], key: Callable[..., str]):
+    """
+    Decorator caching an async endpoint's response in `response_cache`.
+
+    `key` receives the endpoint's keyword arguments and returns the
+    cache key; use a stable prefix per endpoint so writers can
+    invalidate with `response_cache.invalidate_prefix`. ttl=None caches
+    forever (for payloads that only change with a deploy, e.g. /rules).
+
+    functools.wraps preserves the signature, so FastAPI still sees the
+    original query/path parameters.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(**kwargs):
+            cache_key = key(**kwargs)
+            hit = await response_cache.get(cache_key)
+            if hit is not None:
+                return hit
+            result = await func(**kwargs)
+            await response_cache.set(cache_key, result, ttl)
+            return result
+        return wrapper
+    return decorator
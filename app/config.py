@@ -6,13 +6,23 @@ Environment-specific settings and defaults.
 
 import os
 import json
+from functools import lru_cache
 from typing import Optional
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Delegate env parsing to the pydantic-settings Settings in app.core.config
+# (it already reads .env) instead of running a second, independent parse of
+# the same variables here. Fall back to raw env reads if the stricter
+# Settings model can't be built (e.g. required vars missing in dev tools).
+try:
+    from .core.config import get_settings
+    _settings = get_settings()
+except Exception:
+    _settings = None
+    from dotenv import load_dotenv
+    load_dotenv()
 
 
+@lru_cache(maxsize=8)
 def _parse_cors_origins(raw: str) -> list:
     """Parse CORS origins from either JSON array or comma-separated string."""
     raw = raw.strip()
@@ -26,14 +36,18 @@ class Config:
     API_TITLE = "ETHANI Pricing API"
     API_VERSION = "1.0.0"
     API_DESCRIPTION = "Rule-based food price stabilization"
-    
+
     # Server Settings
     HOST = os.getenv("HOST", "0.0.0.0")
     PORT = int(os.getenv("PORT", 8000))
-    DEBUG = os.getenv("DEBUG", "False").lower() == "true"
-    
+    # 0 means "one per CPU" (resolved by the runner); WEB_CONCURRENCY is
+    # the conventional env var on Heroku-style platforms
+    WORKERS = int(os.getenv("WEB_CONCURRENCY", "0"))
+    DEBUG = _settings.DEBUG if _settings else os.getenv("DEBUG", "False").lower() == "true"
+
     # CORS Settings
-    CORS_ORIGINS = _parse_cors_origins(os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8000"))
+    CORS_ORIGINS = (list(_settings.CORS_ORIGINS) if _settings
+                    else _parse_cors_origins(os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8000")))
     CORS_ALLOW_CREDENTIALS = True
     CORS_ALLOW_METHODS = ["*"]
     CORS_ALLOW_HEADERS = ["*"]
@@ -53,11 +67,11 @@ class Config:
     ETHANI_REGION_ADDRESS = os.getenv("ETHANI_REGION_ADDRESS", "0x5836cdDE4D05B0aBDB97AE556a0b9E3971a16143")
     
     # Logging
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL = _settings.LOG_LEVEL if _settings else os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT = "json"  # or "text"
-    
+
     # Storage
-    DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL", None)
+    DATABASE_URL: Optional[str] = _settings.DATABASE_URL if _settings else os.getenv("DATABASE_URL", None)
     CACHE_ENABLED = os.getenv("CACHE_ENABLED", "False").lower() == "true"
 
 class DevelopmentConfig(Config):
@@ -41,20 +41,32 @@ Legacy Endpoints:
   GET /blockchain       - Blockchain integration status
 """
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+import asyncio
+import hashlib
+
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
 from typing import Optional
 from .pricing import (
     calculate_price,
     get_supply_demand_ratio,
-    validate_inputs
+    validate_inputs,
+    pricing_cache_info,
+    _TIERS
 )
-from .blockchain import blockchain
+from .pricing_numba import calc_prices_batch, NUMBA_AVAILABLE
+# get_blockchain defers ContractIntegration construction (env reads,
+# session setup, address checksumming) off the import path: worker
+# forks start serving before the Web3 plumbing is built, and a provider
+# failure degrades to fallback pricing instead of killing the import
+from .blockchain import get_blockchain
+from .cache import cached_blockchain_price
 from .models import (
-    PriceRequest, PriceResponse, RatioResponse, HealthResponse,
-    DetailedPriceResponse
+    PriceRequest, BatchPriceRequest, PriceResponse, RatioResponse,
+    HealthResponse, DetailedPriceResponse
 )
 from .config import config
 
@@ -62,7 +74,10 @@ app = FastAPI(
     title=config.API_TITLE,
     description=config.API_DESCRIPTION,
     version=config.API_VERSION,
-    debug=config.DEBUG
+    debug=config.DEBUG,
+    # orjson serializes these small dict responses several times faster
+    # than the stdlib json encoder Starlette defaults to
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -74,32 +89,150 @@ app.add_middleware(
     allow_headers=config.CORS_ALLOW_HEADERS,
 )
 
-# ========== ROOT ENDPOINT ==========
+# ========== CACHED TIMESTAMP ==========
 
-@app.get("/")
-def root():
-    """API root - redirects to docs"""
-    return {
-        "message": "ETHANI Pricing API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "api_v1": "/api/v1",
-        "endpoints": {
-            "auth": "/api/v1/auth",
-            "products": "/api/v1/products",
-            "market": "/api/v1/market",
-            "orders": "/api/v1/orders",
-            "supply": "/api/v1/supply",
-            "waste": "/api/v1/waste",
-            "profile": "/api/v1/profile"
+# Response timestamps only need ~1s resolution for audit, but
+# datetime.utcnow().isoformat() costs a syscall plus string formatting
+# on every response. A background task refreshes this string once per
+# second; hot paths just read the module global.
+_now_iso: str = datetime.utcnow().isoformat()
+_timestamp_task: Optional[asyncio.Task] = None
+
+
+async def _refresh_timestamp() -> None:
+    """Keep _now_iso fresh at one-second resolution."""
+    global _now_iso
+    while True:
+        _now_iso = datetime.utcnow().isoformat()
+        await asyncio.sleep(1)
+
+
+async def _warm_blockchain() -> None:
+    """Construct the blockchain singleton without blocking startup."""
+    bc = await asyncio.to_thread(get_blockchain)
+    print(f"⛓️  Blockchain Mode: {bc.mode.value}")
+    if bc.contracts_available:
+        print(f"✅ Smart Contracts Ready")
+    else:
+        print(f"⚠️  Using mock pricing (contracts not deployed yet)")
+
+
+def _warm_numba_kernel() -> None:
+    """Trigger the batch kernel's JIT compile off the request path.
+
+    The first call to an @njit function pays the compile (milliseconds
+    with a warm on-disk cache, seconds cold); running it at startup
+    keeps that cost out of the first large /calculate-price-batch.
+    Called synchronously so startup doesn't report ready until the
+    kernel is compiled. The batch endpoint is a sync def, so it runs on
+    threadpool workers - another reason the kernel must stay serial
+    (see the decorator note in pricing_numba).
+    """
+    if NUMBA_AVAILABLE:
+        calc_prices_batch((100, 50), (150, 40), (1000, 1000), (1.0, 1.0))
+
+# ========== STATIC PAYLOADS ==========
+
+# The / and /rules responses are pure constants. Build the dicts once at
+# import and pre-serialize to bytes so a high-RPS GET does zero encoding
+# work per request.
+_ROOT_PAYLOAD = {
+    "message": "ETHANI Pricing API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "api_v1": "/api/v1",
+    "endpoints": {
+        "auth": "/api/v1/auth",
+        "products": "/api/v1/products",
+        "market": "/api/v1/market",
+        "orders": "/api/v1/orders",
+        "supply": "/api/v1/supply",
+        "waste": "/api/v1/waste",
+        "profile": "/api/v1/profile"
+    },
+    "legacy": {
+        "health": "/health",
+        "price": "/price",
+        "rules": "/rules",
+        "blockchain": "/blockchain"
+    }
+}
+
+_RULES_PAYLOAD = {
+    "system": "ETHANI Food Price Stabilization",
+    "method": "Rule-Based Supply-Demand",
+    "ai_used": False,
+    "description": "Deterministic pricing based on supply-demand ratio",
+
+    "supply_demand_tiers": [
+        {
+            "tier": "Critical Shortage",
+            "condition": "Ratio > 1.30 (Demand > 130% of Supply)",
+            "price_adjustment": "+15%",
+            "purpose": "Encourage farmers to increase production"
+        },
+        {
+            "tier": "Shortage",
+            "condition": "Ratio > 1.10 (Demand > 110% of Supply)",
+            "price_adjustment": "+8%",
+            "purpose": "Incentivize supply increase"
         },
-        "legacy": {
-            "health": "/health",
-            "price": "/price",
-            "rules": "/rules",
-            "blockchain": "/blockchain"
+        {
+            "tier": "Balanced",
+            "condition": "0.80 ≤ Ratio ≤ 1.10",
+            "price_adjustment": "0% (base price)",
+            "purpose": "Market equilibrium"
+        },
+        {
+            "tier": "Surplus",
+            "condition": "Ratio < 0.80 (Demand < 80% of Supply)",
+            "price_adjustment": "-10%",
+            "purpose": "Protect consumers from over-supply"
         }
+    ],
+
+    "safeguards": {
+        "max_price_increase": "+50%",
+        "max_price_decrease": "-30%",
+        "purpose": "Prevent extreme volatility and price shocks"
+    },
+
+    "seasonal_adjustment": {
+        "range": "0.5 to 2.0",
+        "default": "1.0",
+        "description": "Adjust for seasonal factors (harvest time, holidays, etc.)"
+    },
+
+    "formula": {
+        "basic": "Final Price = Base Price × Multiplier × Season Factor",
+        "ratio": "Ratio = Demand / Supply",
+        "example": "If base = 100, demand = 150, supply = 100: Ratio = 1.50 → Shortage → Multiplier 1.15 → Price = 115"
     }
+}
+
+_ROOT_BYTES = orjson.dumps(_ROOT_PAYLOAD)
+_RULES_BYTES = orjson.dumps(_RULES_PAYLOAD)
+
+# Precomputed ETags: CDNs and browsers revalidate with If-None-Match
+# and get a bodyless 304 instead of the full payload
+_ROOT_ETAG = f'"{hashlib.md5(_ROOT_BYTES).hexdigest()}"'
+_RULES_ETAG = f'"{hashlib.md5(_RULES_BYTES).hexdigest()}"'
+_STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _static_json(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a pre-serialized constant payload with ETag revalidation."""
+    headers = {"ETag": etag, "Cache-Control": _STATIC_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# ========== ROOT ENDPOINT ==========
+
+@app.get("/")
+def root(request: Request):
+    """API root - redirects to docs"""
+    return _static_json(request, _ROOT_BYTES, _ROOT_ETAG)
 
 # ========== HEALTH CHECK ==========
 
@@ -109,7 +242,7 @@ def health_check() -> dict:
     return {
         "status": "operational",
         "service": "ETHANI Pricing API",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso,
         "ai_used": False,
         "environment": config.ENVIRONMENT if hasattr(config, 'ENVIRONMENT') else None
     }
@@ -143,75 +276,112 @@ def calculate_price_v1(request: PriceRequest) -> dict:
         }
     }
     """
-    try:
-        # Validate inputs
-        is_valid, error_msg = validate_inputs(
-            request.supply,
-            request.demand,
-            request.base_price
-        )
+    # PriceRequest's Field constraints (supply > 0, demand >= 0,
+    # base_price > 0) already rejected invalid input with a 422, so no
+    # validate_inputs re-check here. Unexpected errors propagate to the
+    # registered exception handlers (proper 4xx/5xx status codes)
+    # instead of being swallowed into a 200 body.
+    result = calculate_price(
+        request.supply,
+        request.demand,
+        request.base_price,
+        request.season_factor,
+        verbose=False
+    )
+
+    # Tier info comes fused in the calculate_price result - no second
+    # ratio/tier computation
+    # Calculate adjustment percent
+    adj_percent = round(((result['suggested_price'] - request.base_price) / request.base_price) * 100)
+
+    return {
+        "success": True,
+        "data": {
+            "final_price": result['suggested_price'],
+            "pricing_tier": result['tier_number'],
+            "adjustment_percent": adj_percent,
+            "explanation": result['reason'],
+            "ratio": result['ratio'],
+            "calculation_method": "rule_based",
+            "timestamp": _now_iso
+        }
+    }
+
+@app.post("/api/v1/pricing/batch")
+def calculate_price_batch(request: BatchPriceRequest) -> dict:
+    """
+    Batch pricing endpoint - evaluate up to 100 price requests in one call.
+
+    Dashboards querying N products over /api/v1/pricing/calculate pay N
+    HTTP round-trips plus N passes of FastAPI dispatch and Pydantic
+    parsing; this amortizes all of that into a single request. Partial
+    failures land in "errors" (with the item index) instead of aborting
+    the whole batch.
+    """
+    # Bind hot callables to locals: skips a global + attribute lookup
+    # per item inside the loop
+    _validate = validate_inputs
+    _calculate = calculate_price
+
+    valid = []
+    errors = []
+    for index, item in enumerate(request.items):
+        is_valid, error_msg = _validate(item.supply, item.demand, item.base_price)
         if not is_valid:
-            return {
-                "success": False,
-                "error": error_msg
-            }
-        
-        # Calculate price using rule-based engine
-        result = calculate_price(
-            request.supply,
-            request.demand,
-            request.base_price,
-            getattr(request, 'season_factor', 1.0)
+            errors.append({"index": index, "error": error_msg})
+        else:
+            valid.append((index, item))
+
+    results = []
+    # Large batches go through the compiled numba kernel (one pass over
+    # arrays); small ones stay on the scalar LRU-cached path where the
+    # array packing overhead wouldn't pay off
+    if NUMBA_AVAILABLE and len(valid) >= 32:
+        batch = calc_prices_batch(
+            [item.supply for _, item in valid],
+            [item.demand for _, item in valid],
+            [item.base_price for _, item in valid],
+            [item.season_factor for _, item in valid]
         )
-        
-        # Get tier information
-        ratio_result = get_supply_demand_ratio(request.supply, request.demand)
-        
-        # Map tier number
-        tier_map = {
-            "critical_shortage": 1,
-            "shortage": 2,
-            "balanced": 3,
-            "surplus": 4
-        }
-        tier_num = tier_map.get(ratio_result['tier'], 3)
-        
-        # Calculate adjustment percent
-        adj_percent = round(((result['suggested_price'] - request.base_price) / request.base_price) * 100)
-        
-        return {
-            "success": True,
-            "data": {
+        prices, _mults, tier_indices, capped_flags = batch
+        for (index, item), price, tier_idx, capped in zip(
+                valid, prices, tier_indices, capped_flags):
+            tier, _, reason, _, _ = _TIERS[tier_idx]
+            if capped:
+                reason += (" [CAPPED at +50%]" if price > item.base_price
+                           else " [FLOORED at -30%]")
+            results.append({
+                "index": index,
+                "final_price": price,
+                "ratio": round(item.demand / item.supply, 2),
+                "tier": tier,
+                "explanation": reason,
+                "is_capped": bool(capped)
+            })
+    else:
+        for index, item in valid:
+            result = _calculate(item.supply, item.demand, item.base_price,
+                                item.season_factor, verbose=False)
+            results.append({
+                "index": index,
                 "final_price": result['suggested_price'],
-                "pricing_tier": tier_num,
-                "adjustment_percent": adj_percent,
+                "ratio": result['ratio'],
+                "tier": result['tier'],
                 "explanation": result['reason'],
-                "ratio": ratio_result['ratio'],
-                "calculation_method": "rule_based",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
+                "is_capped": result['is_capped']
+            })
 
-@app.get("/health")
-def health_check() -> dict:
-    """Health check endpoint"""
     return {
-        "status": "operational",
-        "service": "ETHANI Pricing API",
-        "timestamp": datetime.utcnow().isoformat(),
-        "ai_used": False,
-        "environment": config.ENVIRONMENT if hasattr(config, 'ENVIRONMENT') else None
+        "success": not errors,
+        "count": len(results),
+        "results": results,
+        "errors": errors
     }
 
 # ========== PRICE ENDPOINTS ==========
 
 @app.get("/price")
-def get_price(
+async def get_price(
     supply: int = Query(..., gt=0, description="Food supply units"),
     demand: int = Query(..., ge=0, description="Food demand units"),
     base_price: int = Query(..., gt=0, description="Base/reference price"),
@@ -245,9 +415,13 @@ def get_price(
     if not is_valid:
         raise HTTPException(status_code=400, detail=error_msg)
     
-    # CALL SMART CONTRACT for price calculation
+    # CALL SMART CONTRACT for price calculation (async: the event loop
+    # multiplexes in-flight RPCs instead of tying up a threadpool
+    # worker; identical concurrent queries coalesce into one call)
     # Per Spec Section III: "Call pricing contracts"
-    contract_result = blockchain.calculate_price(supply, demand, base_price, region)
+    contract_result = await cached_blockchain_price(
+        get_blockchain(), supply, demand, base_price, region
+    )
     
     # Return SPEC-COMPLIANT response (Section V)
     return {
@@ -320,7 +494,7 @@ def calculate_price_detailed(request: PriceRequest) -> dict:
     ratio_analysis = get_supply_demand_ratio(request.supply, request.demand)
     
     return {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso,
         "inputs": {
             "supply": request.supply,
             "demand": request.demand,
@@ -345,76 +519,32 @@ def calculate_price_detailed(request: PriceRequest) -> dict:
 # ========== RULES ENDPOINT ==========
 
 @app.get("/rules")
-def get_pricing_rules() -> dict:
+def get_pricing_rules(request: Request):
     """
     Get all pricing rules and thresholds.
     Complete transparency - see exactly how prices are calculated.
     """
-    
-    return {
-        "system": "ETHANI Food Price Stabilization",
-        "method": "Rule-Based Supply-Demand",
-        "ai_used": False,
-        "description": "Deterministic pricing based on supply-demand ratio",
-        
-        "supply_demand_tiers": [
-            {
-                "tier": "Critical Shortage",
-                "condition": "Ratio > 1.30 (Demand > 130% of Supply)",
-                "price_adjustment": "+15%",
-                "purpose": "Encourage farmers to increase production"
-            },
-            {
-                "tier": "Shortage",
-                "condition": "Ratio > 1.10 (Demand > 110% of Supply)",
-                "price_adjustment": "+8%",
-                "purpose": "Incentivize supply increase"
-            },
-            {
-                "tier": "Balanced",
-                "condition": "0.80 ≤ Ratio ≤ 1.10",
-                "price_adjustment": "0% (base price)",
-                "purpose": "Market equilibrium"
-            },
-            {
-                "tier": "Surplus",
-                "condition": "Ratio < 0.80 (Demand < 80% of Supply)",
-                "price_adjustment": "-10%",
-                "purpose": "Protect consumers from over-supply"
-            }
-        ],
-        
-        "safeguards": {
-            "max_price_increase": "+50%",
-            "max_price_decrease": "-30%",
-            "purpose": "Prevent extreme volatility and price shocks"
-        },
-        
-        "seasonal_adjustment": {
-            "range": "0.5 to 2.0",
-            "default": "1.0",
-            "description": "Adjust for seasonal factors (harvest time, holidays, etc.)"
-        },
-        
-        "formula": {
-            "basic": "Final Price = Base Price × Multiplier × Season Factor",
-            "ratio": "Ratio = Demand / Supply",
-            "example": "If base = 100, demand = 150, supply = 100: Ratio = 1.50 → Shortage → Multiplier 1.15 → Price = 115"
-        }
-    }
+    return _static_json(request, _RULES_BYTES, _RULES_ETAG)
+
+# ========== METRICS ==========
+
+@app.get("/metrics/pricing-cache")
+def pricing_cache_metrics() -> dict:
+    """Hit/miss stats for the memoized pricing functions."""
+    return pricing_cache_info()
 
 # ========== ERROR HANDLERS ==========
 
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"detail": str(exc)}
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
@@ -424,19 +554,25 @@ async def general_exception_handler(request, exc):
 @app.on_event("startup")
 async def startup_event():
     """Run on server startup"""
+    global _timestamp_task
+    _timestamp_task = asyncio.create_task(_refresh_timestamp())
+    # Build the blockchain singleton on a worker thread so the Web3
+    # handshake overlaps with uvicorn accepting connections
+    asyncio.create_task(_warm_blockchain())
+    _warm_numba_kernel()
+    # Catch accidental duplicate registrations (a second decorator on
+    # the same path/methods silently shadows the first)
+    route_keys = [(r.path, tuple(sorted(r.methods)))
+                  for r in app.routes if hasattr(r, "methods")]
+    assert len(set(route_keys)) == len(route_keys), "duplicate route registration"
     print(f"🚀 ETHANI API starting...")
     print(f"📊 Pricing Engine: Rule-based (No AI)")
     print(f"🌍 Environment: {config.ENVIRONMENT if hasattr(config, 'ENVIRONMENT') else 'development'}")
     print(f"🔐 API v1 endpoints available at /api/v1")
-    print(f"⛓️  Blockchain Mode: {blockchain.mode.value}")
-    if blockchain.contracts_available:
-        print(f"✅ Smart Contracts Ready")
-    else:
-        print(f"⚠️  Using mock pricing (contracts not deployed yet)")
 
 
 @app.get("/blockchain")
-def blockchain_status():
+async def blockchain_status(request: Request):
     """
     Check blockchain integration status.
     
@@ -447,21 +583,39 @@ def blockchain_status():
     - region_contract: EthaniRegion contract address
     - ready: true if all contracts deployed and accessible
     """
-    return blockchain.health_check()
+    # Status only changes on redeploy/config flips, so let clients
+    # revalidate cheaply; the ETag is derived from the serialized body
+    body = orjson.dumps(get_blockchain().health_check())
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on server shutdown"""
+    if _timestamp_task is not None:
+        _timestamp_task.cancel()
     print("🛑 ETHANI API shutting down...")
 
 # ========== RUN ==========
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
+
+    # Import string (not the app object) so multi-worker mode can fork;
+    # uvloop + httptools replace the default event loop and h11 parser
     uvicorn.run(
-        app,
+        "app.main:app",
         host=config.HOST,
         port=config.PORT,
-        debug=config.DEBUG
+        loop="uvloop",
+        http="httptools",
+        workers=config.WORKERS or os.cpu_count() or 1,
+        limit_concurrency=1024,
+        log_level=config.LOG_LEVEL.lower()
     )
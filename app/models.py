@@ -4,27 +4,36 @@ ETHANI Backend Data Models
 Pydantic models for request/response validation.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 class PriceRequest(BaseModel):
     """Request model for price calculation"""
-    supply: int = Field(..., gt=0, description="Food supply units")
-    demand: int = Field(..., ge=0, description="Food demand units")
-    base_price: int = Field(..., gt=0, description="Base/reference price")
-    season_factor: Optional[float] = Field(
+    # le bound mirrors pricing.MAX_INPUT_VALUE: rejects pathological
+    # values before they reach the arithmetic
+    supply: int = Field(..., gt=0, le=10**12, description="Food supply units")
+    demand: int = Field(..., ge=0, le=10**12, description="Food demand units")
+    base_price: int = Field(..., gt=0, le=10**12, description="Base/reference price")
+    # Range enforcement lives in the Field constraints: pydantic-core
+    # checks them in Rust, so no Python-level @validator callback runs
+    # per request. Non-optional: the default means it's always a float,
+    # so downstream code skips None checks.
+    season_factor: float = Field(
         default=1.0,
         ge=0.5,
         le=2.0,
         description="Seasonal multiplier"
     )
 
-    @validator('season_factor')
-    def validate_season_factor(cls, v):
-        if v is not None and (v < 0.5 or v > 2.0):
-            raise ValueError('Season factor must be between 0.5 and 2.0')
-        return v
+class BatchPriceRequest(BaseModel):
+    """Request model for batch price calculation"""
+    items: List[PriceRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Price requests to evaluate in one call"
+    )
 
 class PriceResponse(BaseModel):
     """Response model for price calculation"""
@@ -18,6 +18,11 @@ Hard Limits (Safeguards):
 All calculations are deterministic, auditable, and reproducible.
 """
 
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+
 # ========== PRICING CONSTANTS ==========
 
 # Supply-demand ratio thresholds
@@ -35,22 +40,128 @@ SURPLUS_MULTIPLIER = 0.90            # -10%
 MAX_PRICE_INCREASE = 1.50            # +50%
 MAX_PRICE_DECREASE = 0.70            # -30%
 
+# Upper bound on supply/demand/base_price. Keeps the fixed-point math
+# in machine-int range and stops pathological inputs (e.g. 10**18)
+# from burning CPU in arbitrary-precision multiplies; far beyond
+# anything the price-stability contract would process.
+MAX_INPUT_VALUE = 10**12
+
+# Tier lookup shared by calculate_price and get_supply_demand_ratio:
+# one bisect against sorted bounds replaces the duplicated if/elif
+# ladder (and its LOAD_GLOBAL per compare). nextafter nudges the upper
+# bounds so bisect_right keeps ratio == 1.10 / 1.30 in the lower tier,
+# exactly matching the old strict ">" comparisons.
+_TIER_BOUNDS = (
+    SURPLUS_THRESHOLD,
+    math.nextafter(SHORTAGE_THRESHOLD, 2.0),
+    math.nextafter(CRITICAL_SHORTAGE_THRESHOLD, 2.0),
+)
+
+# Basis-point forms for the integer hot path: all price math is done in
+# C-implemented int arithmetic (base * mult_bps * season_bps scaled by
+# 1e8), matching the smart contract's fixed-point math instead of
+# accumulating float error. Indexed in lockstep with _TIERS.
+_TIER_MULT_BPS = (9000, 10000, 10800, 11500)
+_MAX_INCREASE_BPS = 15000   # +50%
+_MAX_DECREASE_BPS = 7000    # -30%
+
+# (tier, multiplier, price_reason, tier_description, tier_number)
+_TIERS = (
+    ("surplus", SURPLUS_MULTIPLIER,
+     "Surplus available (ratio < 0.80)", "Surplus - price -10%", 4),
+    ("balanced", NORMAL_MULTIPLIER,
+     "Balanced supply-demand (0.80-1.10)", "Balanced supply-demand - price baseline", 3),
+    ("shortage", SHORTAGE_MULTIPLIER,
+     "Shortage detected (ratio > 1.10)", "Shortage - price +8%", 2),
+    ("critical_shortage", CRITICAL_SHORTAGE_MULTIPLIER,
+     "Critical shortage (ratio > 1.30)", "Critical shortage - price +15%", 1),
+)
+
+# Read-only tier-name -> API tier number view for external consumers;
+# built once from _TIERS so the numbering can't drift or be mutated
+TIER_NUMBERS = MappingProxyType({tier: num for tier, _, _, _, num in _TIERS})
+
+
+@lru_cache(maxsize=8192)
+def _calculate_price_cached(
+    supply: int,
+    demand: int,
+    base_price: int,
+    season_factor: float,
+    # Bound as defaults so the body uses LOAD_FAST instead of a module
+    # globals lookup per reference
+    _bisect=bisect_right,
+    _bounds=_TIER_BOUNDS,
+    _tiers=_TIERS,
+    _mult_bps=_TIER_MULT_BPS,
+    _max_bps=_MAX_INCREASE_BPS,
+    _min_bps=_MAX_DECREASE_BPS
+) -> tuple:
+    """
+    Memoized pricing core.
+
+    Pure function of its arguments, so repeat queries (dashboards,
+    polling clients) hit the LRU instead of re-running the branch
+    ladder. Returns an immutable tuple - callers build their own dict
+    so mutating a response can never poison the cache.
+
+    Returns:
+        (suggested_price, ratio, multiplier, reason, is_capped,
+         raw_price, tier, tier_number)
+    """
+
+    # Calculate demand-supply ratio (float only for tier selection and
+    # the response; price math below stays in exact integers)
+    ratio = demand / supply
+
+    # Determine multiplier based on ratio (single bisect into the table)
+    idx = _bisect(_bounds, ratio)
+    tier, multiplier, tier_reason, _, tier_num = _tiers[idx]
+
+    # Integer fixed-point price: base * mult_bps * season_bps, carrying
+    # a 1e8 scale factor - no float rounding drift vs the contract
+    season_bps = round(season_factor * 10000)
+    calculated = base_price * _mult_bps[idx] * season_bps
+
+    # Apply hard limits to prevent extreme swings (same 1e8 scale)
+    max_allowed = base_price * _max_bps * 10000
+    min_allowed = base_price * _min_bps * 10000
+
+    is_capped = False
+    if calculated > max_allowed:
+        calculated = max_allowed
+        tier_reason += " [CAPPED at +50%]"
+        is_capped = True
+    elif calculated < min_allowed:
+        calculated = min_allowed
+        tier_reason += " [FLOORED at -30%]"
+        is_capped = True
+
+    # Descale with round-half-up, all in int arithmetic
+    final_price = (calculated + 50_000_000) // 100_000_000
+
+    return (final_price, ratio, multiplier, tier_reason, is_capped,
+            calculated // 100_000_000, tier, tier_num)
+
 
 def calculate_price(
     supply: int,
     demand: int,
     base_price: int,
-    season_factor: float = 1.0
+    season_factor: float = 1.0,
+    verbose: bool = True
 ) -> dict:
     """
     Calculate fair food price using rule-based supply-demand formula.
-    
+
     Args:
         supply (int): Current food supply units
         demand (int): Current food demand units
         base_price (int): Reference/baseline price
         season_factor (float): Seasonal adjustment (0.8-1.2 typical range)
-    
+        verbose (bool): Include the 'calculations' breakdown (formula
+            strings); pass False on hot paths that don't display it
+
     Returns:
         dict: {
             'suggested_price': int,
@@ -61,7 +172,7 @@ def calculate_price(
             'calculations': {...}
         }
     """
-    
+
     if supply <= 0:
         return {
             'suggested_price': base_price,
@@ -69,6 +180,8 @@ def calculate_price(
             'multiplier': 1.0,
             'reason': 'No supply available - using base price',
             'is_capped': False,
+            'tier': 'error',
+            'tier_number': 3,
             'calculations': {
                 'base_price': base_price,
                 'supply': supply,
@@ -76,50 +189,22 @@ def calculate_price(
                 'season_factor': season_factor
             }
         }
-    
-    # Calculate demand-supply ratio
-    ratio = demand / supply
-    
-    # Determine multiplier based on ratio
-    if ratio > CRITICAL_SHORTAGE_THRESHOLD:
-        multiplier = CRITICAL_SHORTAGE_MULTIPLIER
-        tier_reason = "Critical shortage (ratio > 1.30)"
-    elif ratio > SHORTAGE_THRESHOLD:
-        multiplier = SHORTAGE_MULTIPLIER
-        tier_reason = "Shortage detected (ratio > 1.10)"
-    elif ratio < SURPLUS_THRESHOLD:
-        multiplier = SURPLUS_MULTIPLIER
-        tier_reason = "Surplus available (ratio < 0.80)"
-    else:
-        multiplier = NORMAL_MULTIPLIER
-        tier_reason = "Balanced supply-demand (0.80-1.10)"
-    
-    # Apply multiplier and seasonal factor
-    calculated_price = base_price * multiplier * season_factor
-    
-    # Apply hard limits to prevent extreme swings
-    max_allowed = base_price * MAX_PRICE_INCREASE
-    min_allowed = base_price * MAX_PRICE_DECREASE
-    
-    is_capped = False
-    if calculated_price > max_allowed:
-        calculated_price = max_allowed
-        tier_reason += " [CAPPED at +50%]"
-        is_capped = True
-    elif calculated_price < min_allowed:
-        calculated_price = min_allowed
-        tier_reason += " [FLOORED at -30%]"
-        is_capped = True
-    
-    # Round to nearest integer
-    final_price = int(round(calculated_price))
-    
+
+    # Quantize the float key so e.g. 1.0000001 and 1.0 share a cache slot
+    season_factor = round(season_factor, 3)
+
+    (final_price, ratio, multiplier, tier_reason, is_capped,
+     calculated_price, tier, tier_num) = \
+        _calculate_price_cached(supply, demand, base_price, season_factor)
+
     return {
         'suggested_price': final_price,
         'ratio': round(ratio, 2),
         'multiplier': round(multiplier, 2),
         'reason': tier_reason,
         'is_capped': is_capped,
+        'tier': tier,
+        'tier_number': tier_num,
         'calculations': {
             'base_price': base_price,
             'supply': supply,
@@ -127,7 +212,7 @@ def calculate_price(
             'season_factor': season_factor,
             'ratio_formula': f"{demand} / {supply} = {round(ratio, 2)}",
             'price_formula': f"{base_price} × {round(multiplier, 2)} × {season_factor} = {int(calculated_price)}"
-        }
+        } if verbose else None
     }
 
 
@@ -148,31 +233,35 @@ def get_supply_demand_ratio(supply: int, demand: int) -> dict:
             'tier': 'error',
             'tier_description': 'No supply to calculate ratio'
         }
-    
-    ratio = demand / supply
-    
-    if ratio > CRITICAL_SHORTAGE_THRESHOLD:
-        tier = "critical_shortage"
-        tier_desc = "Critical shortage - price +15%"
-    elif ratio > SHORTAGE_THRESHOLD:
-        tier = "shortage"
-        tier_desc = "Shortage - price +8%"
-    elif ratio < SURPLUS_THRESHOLD:
-        tier = "surplus"
-        tier_desc = "Surplus - price -10%"
-    else:
-        tier = "balanced"
-        tier_desc = "Balanced supply-demand - price baseline"
-    
+
+    ratio, tier, tier_desc, tier_num = _ratio_tier_cached(supply, demand)
+
     return {
-        'ratio': round(ratio, 2),
+        'ratio': ratio,
         'tier': tier,
+        'tier_number': tier_num,
         'tier_description': tier_desc,
         'supply': supply,
         'demand': demand
     }
 
 
+@lru_cache(maxsize=8192)
+def _ratio_tier_cached(supply: int, demand: int) -> tuple:
+    """Memoized ratio/tier classification (same table as the pricing core)."""
+    ratio = demand / supply
+    tier, _, _, tier_desc, tier_num = _TIERS[bisect_right(_TIER_BOUNDS, ratio)]
+    return (round(ratio, 2), tier, tier_desc, tier_num)
+
+
+def pricing_cache_info() -> dict:
+    """Hit/miss counters for the pricing LRU caches (for /metrics)."""
+    return {
+        'calculate_price': _calculate_price_cached.cache_info()._asdict(),
+        'supply_demand_ratio': _ratio_tier_cached.cache_info()._asdict()
+    }
+
+
 def validate_inputs(supply: int, demand: int, base_price: int) -> tuple[bool, str]:
     """
     Validate pricing inputs to prevent errors.
@@ -180,13 +269,20 @@ def validate_inputs(supply: int, demand: int, base_price: int) -> tuple[bool, st
     Returns:
         (is_valid, error_message)
     """
+    # Single combined check on the common (valid) path; the per-field
+    # diagnosis below only runs for rejected input
+    if (0 < base_price <= MAX_INPUT_VALUE
+            and 0 <= supply <= MAX_INPUT_VALUE
+            and 0 <= demand <= MAX_INPUT_VALUE
+            and (supply or not demand)):
+        return True, ""
+
+    if base_price > MAX_INPUT_VALUE or supply > MAX_INPUT_VALUE or demand > MAX_INPUT_VALUE:
+        return False, "Input exceeds maximum allowed value (10^12)"
     if base_price <= 0:
         return False, "Base price must be positive"
     if supply < 0:
         return False, "Supply cannot be negative"
     if demand < 0:
         return False, "Demand cannot be negative"
-    if supply == 0 and demand > 0:
-        return False, "Cannot have demand with zero supply"
-    
-    return True, ""
+    return False, "Cannot have demand with zero supply"
@@ -0,0 +1,142 @@
+"""
+ETHANI Vectorized Batch Pricing - Optional Numba Acceleration
+
+Compiled kernel for the batch pricing endpoint: N price calculations
+become one pass over NumPy arrays instead of N Python iterations.
+
+numba and numpy are optional - when either is missing the public
+wrapper reports unavailable and callers stay on the scalar
+calculate_price loop, so deployments don't need the compiler
+toolchain. Tier indices match app.pricing._TIERS (0=surplus,
+1=balanced, 2=shortage, 3=critical_shortage).
+"""
+
+from .pricing import (
+    CRITICAL_SHORTAGE_THRESHOLD,
+    SHORTAGE_THRESHOLD,
+    SURPLUS_THRESHOLD,
+    CRITICAL_SHORTAGE_MULTIPLIER,
+    SHORTAGE_MULTIPLIER,
+    NORMAL_MULTIPLIER,
+    SURPLUS_MULTIPLIER,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = np is not None
+except ImportError:  # pragma: no cover
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator stand-in: the kernel runs as plain Python."""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+# cache=True persists the compiled kernel across processes, avoiding
+# the multi-second first-compile hit on every server start.
+# Deliberately serial: batches are capped at 100 items, far below where
+# prange thread fan-out pays off, and numba's threading layer wedges
+# interpreter shutdown if the kernel is first entered from a non-main
+# thread (which sync-def endpoints running in the threadpool can do).
+@njit(cache=True)
+def _calc_prices_kernel(supply, demand, base_price, season_factor,
+                        out_price, out_mult, out_tier, out_capped):
+    """
+    Compiled pricing loop over 1-D int64/float64 arrays.
+
+    Same rules as app.pricing._calculate_price_cached: tier multiplier
+    from the demand/supply ratio, season factor, then clamp to
+    [-30%, +50%] of base. Writes results into the out arrays.
+    """
+    for i in range(supply.shape[0]):
+        base = base_price[i]
+        if supply[i] <= 0:
+            out_price[i] = base
+            out_mult[i] = 1.0
+            out_tier[i] = 1
+            out_capped[i] = 0
+            continue
+
+        ratio = demand[i] / supply[i]
+        if ratio > CRITICAL_SHORTAGE_THRESHOLD:
+            mult = CRITICAL_SHORTAGE_MULTIPLIER
+            mult_bps = 11500.0
+            tier = 3
+        elif ratio > SHORTAGE_THRESHOLD:
+            mult = SHORTAGE_MULTIPLIER
+            mult_bps = 10800.0
+            tier = 2
+        elif ratio < SURPLUS_THRESHOLD:
+            mult = SURPLUS_MULTIPLIER
+            mult_bps = 9000.0
+            tier = 0
+        else:
+            mult = NORMAL_MULTIPLIER
+            mult_bps = 10000.0
+            tier = 1
+
+        # Same 1e8-scaled fixed-point math as the scalar core: the
+        # intermediate values are integral, so float64 carries them
+        # exactly for any realistic base price (< 2^53 / 1.5e8)
+        season_bps = np.floor(season_factor[i] * 10000.0 + 0.5)
+        price = base * mult_bps * season_bps
+        max_allowed = base * 150000000.0
+        min_allowed = base * 70000000.0
+
+        capped = 0
+        if price > max_allowed:
+            price = max_allowed
+            capped = 1
+        elif price < min_allowed:
+            price = min_allowed
+            capped = 1
+
+        # Descale with half-up rounding, matching
+        # app.pricing._calculate_price_cached
+        out_price[i] = int(np.floor((price + 50000000.0) / 100000000.0))
+        out_mult[i] = mult
+        out_tier[i] = tier
+        out_capped[i] = capped
+
+
+def calc_prices_batch(supplies, demands, base_prices, season_factors):
+    """
+    Vectorized batch pricing over parallel sequences.
+
+    Args:
+        supplies, demands, base_prices: sequences of int
+        season_factors: sequence of float
+
+    Returns:
+        (prices, multipliers, tier_indices, capped_flags) as lists, or
+        None when numba/numpy aren't installed (caller falls back to
+        the scalar loop).
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+
+    n = len(supplies)
+    supply = np.fromiter(supplies, dtype=np.int64, count=n)
+    demand = np.fromiter(demands, dtype=np.int64, count=n)
+    base_price = np.fromiter(base_prices, dtype=np.int64, count=n)
+    season_factor = np.fromiter(season_factors, dtype=np.float64, count=n)
+
+    out_price = np.empty(n, dtype=np.int64)
+    out_mult = np.empty(n, dtype=np.float64)
+    out_tier = np.empty(n, dtype=np.int64)
+    out_capped = np.empty(n, dtype=np.uint8)
+
+    _calc_prices_kernel(supply, demand, base_price, season_factor,
+                        out_price, out_mult, out_tier, out_capped)
+
+    return (out_price.tolist(), out_mult.tolist(),
+            out_tier.tolist(), out_capped.tolist())
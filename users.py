@@ -8,21 +8,352 @@ Handles:
 - Phone-based deduplication
 """
 
-import sqlite3
+import asyncio
+import atexit
+import functools
 import os
-import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict
 from pathlib import Path
 
+try:
+    import apsw
+except ImportError:  # pragma: no cover - apsw is optional
+    apsw = None
+
 DB_PATH = Path(__file__).parent / "ethani_users.db"
 
 
+def _configure(conn):
+    """Apply per-connection PRAGMAs tuned for this workload.
+
+    synchronous=NORMAL halves fsync traffic under WAL while keeping the
+    database consistent after a crash; temp_store/mmap/cache keep sorts
+    and hot pages in memory; busy_timeout makes concurrent writers wait
+    out a lock instead of raising "database is locked".
+    """
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+def _connect():
+    """Open a configured connection to the users database."""
+    return _configure(sqlite3.connect(DB_PATH, cached_statements=256))
+
+
+def _set_journal_mode(conn):
+    """Switch the database file to WAL (persistent; once per file).
+
+    WAL lets readers proceed during writes and turns a commit into one
+    sequential log append instead of a journal + main-file double
+    write. Meaningless for in-memory databases, so skipped there.
+    """
+    if str(DB_PATH) != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+
+
+# One long-lived connection per thread: connect-per-call paid ~200µs of
+# setup per query and threw away SQLite's page cache every time. The
+# async facade runs these functions on executor threads, so thread-local
+# storage gives each worker its own connection without locking.
+_pool = threading.local()
+_pool_conns = []
+_pool_lock = threading.Lock()
+
+
+def _get_conn():
+    """Return this thread's pooled connection, creating it on first use."""
+    conn = getattr(_pool, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(
+            DB_PATH, check_same_thread=False, cached_statements=256
+        )
+        _configure(conn)
+        conn.row_factory = sqlite3.Row
+        _pool.conn = conn
+        with _pool_lock:
+            _pool_conns.append(conn)
+    return conn
+
+
+@atexit.register
+def _close_pool():
+    """Close every pooled connection at interpreter shutdown."""
+    with _pool_lock:
+        for conn in _pool_conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        _pool_conns.clear()
+
+
+def _get_apsw_conn():
+    """Thread-local apsw connection for hot point lookups, or None.
+
+    apsw sits closer to SQLite's C API than stdlib sqlite3 - no row
+    factory, fewer per-column transitions - which matters on the
+    highest-QPS single-row reads once the page cache is hot. Entirely
+    optional: callers fall back to the pooled stdlib connection when
+    apsw isn't installed.
+    """
+    if apsw is None:
+        return None
+    conn = getattr(_pool, "apsw_conn", None)
+    if conn is None:
+        conn = apsw.Connection(str(DB_PATH), statementcachesize=256)
+        conn.setbusytimeout(5000)
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-65536")
+        _pool.apsw_conn = conn
+        with _pool_lock:
+            _pool_conns.append(conn)
+    return conn
+
+
+def _point_cursor():
+    """Per-thread long-lived cursor for single-row hot lookups.
+
+    Reusing one cursor skips the Cursor allocation/initialization per
+    call on the highest-QPS point reads. Thread-local like the
+    connection it belongs to, so it never crosses threads; bulk readers
+    keep making their own cursors.
+    """
+    cursor = getattr(_pool, "point_cursor", None)
+    if cursor is None:
+        cursor = _get_conn().cursor()
+        _pool.point_cursor = cursor
+    return cursor
+
+
+# Statements reused across functions live here so the text can't drift
+# between call sites; together with cached_statements=256 on the pooled
+# connections, each is parsed and planned once per connection, then
+# reused as compiled bytecode.
+_SQL_USER_COLS = "id, phone, name, email, location, role, points"
+_USER_KEYS = tuple(_SQL_USER_COLS.split(", "))
+_SQL_GET_USER_BY_PHONE = (
+    f"SELECT {_SQL_USER_COLS} FROM users WHERE phone = ? AND is_active = 1"
+)
+_SQL_GET_USER_BY_ID = (
+    f"SELECT {_SQL_USER_COLS} FROM users WHERE id = ? AND is_active = 1"
+)
+_SQL_USER_EXISTS = "SELECT 1 FROM users WHERE phone = ? AND is_active = 1"
+_SQL_ADD_POINTS = "UPDATE users SET points = points + ? WHERE id = ?"
+
+# deliveries.status is stored as a small integer: 1-byte index keys and
+# O(1) comparisons instead of TEXT. The names stay the public API shape;
+# translation happens at this module's boundary.
+_DELIVERY_STATUS_CODES = {"pending": 0, "in_transit": 1, "completed": 2}
+_DELIVERY_STATUS_NAMES = {code: name for name, code in _DELIVERY_STATUS_CODES.items()}
+
+
+def _rows_to_dicts(cursor):
+    """Materialize all cursor rows as dicts.
+
+    The column-name tuple is read once from cursor.description and
+    zipped against the raw row tuples - measurably faster than
+    dict(row) per row, which re-hashes every key name for each row.
+    """
+    keys = [d[0] for d in cursor.description]
+    return [dict(zip(keys, row)) for row in cursor]
+
+
+# Flipped after the first index check so init_db stays cheap on the
+# per-call fast path
+_indexes_ensured = False
+
+
+def _ensure_indexes(conn):
+    """Create lookup indexes once per process (idempotent in SQL too)"""
+    global _indexes_ensured
+    if _indexes_ensured:
+        return
+    cursor = conn.cursor()
+    # Partial indexes restricted to is_active = 1: every user read
+    # filters on it, so deactivated rows never enter the scanned B-tree
+    # and churn costs nothing on the read paths. The old full role/
+    # location indexes are superseded and dropped.
+    cursor.execute("DROP INDEX IF EXISTS idx_users_role")
+    cursor.execute("DROP INDEX IF EXISTS idx_users_location")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_active_phone "
+                   "ON users(phone) WHERE is_active = 1")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_active_role "
+                   "ON users(role) WHERE is_active = 1")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_active_location "
+                   "ON users(location) WHERE is_active = 1")
+    # Composite (filter, timestamp DESC) indexes serve the newest-first
+    # report/delivery queries without a separate sort pass; the region
+    # one also covers the 7-day window scan in get_regional_metrics
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_supply_user "
+                   "ON supply_reports(user_id, timestamp DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_supply_region_ts "
+                   "ON supply_reports(region, timestamp DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_waste_user "
+                   "ON waste_tracking(user_id, timestamp DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_deliveries_status "
+                   "ON deliveries(status, timestamp DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_deliveries_distributor "
+                   "ON deliveries(distributor_id)")
+    conn.commit()
+    _indexes_ensured = True
+
+
+def _ensure_waste_schema(conn):
+    """Upgrade waste_tracking to a generated energy_credits column.
+
+    The credit formula lives in the schema (quantity_kg * 0.5 STORED)
+    so every writer gets the same value for free. Databases created
+    before the generated column are rebuilt once - detected via the
+    hidden flag in pragma_table_xinfo (0 = plain column).
+    """
+    row = conn.execute(
+        "SELECT hidden FROM pragma_table_xinfo('waste_tracking') "
+        "WHERE name = 'energy_credits'"
+    ).fetchone()
+    if row is None or row[0] != 0:
+        return
+
+    conn.executescript("""
+    CREATE TABLE waste_tracking_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        waste_type TEXT NOT NULL,
+        quantity_kg REAL NOT NULL,
+        processing_method TEXT,
+        energy_credits REAL GENERATED ALWAYS AS (quantity_kg * 0.5) STORED,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    );
+    INSERT INTO waste_tracking_new
+        (id, user_id, waste_type, quantity_kg, processing_method, timestamp)
+        SELECT id, user_id, waste_type, quantity_kg, processing_method, timestamp
+        FROM waste_tracking;
+    DROP TABLE waste_tracking;
+    ALTER TABLE waste_tracking_new RENAME TO waste_tracking;
+    CREATE INDEX IF NOT EXISTS idx_waste_user
+        ON waste_tracking(user_id, timestamp DESC);
+    """)
+
+
+def _ensure_delivery_schema(conn):
+    """Upgrade deliveries.status from TEXT to the integer enum.
+
+    Detected via the declared column type in pragma_table_info;
+    databases created with the TEXT column are rebuilt once, mapping
+    the old names onto the codes in _DELIVERY_STATUS_CODES.
+    """
+    row = conn.execute(
+        "SELECT type FROM pragma_table_info('deliveries') WHERE name = 'status'"
+    ).fetchone()
+    if row is None or row[0] != "TEXT":
+        return
+
+    conn.executescript("""
+    CREATE TABLE deliveries_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        distributor_id INTEGER NOT NULL,
+        origin_location TEXT NOT NULL,
+        destination_location TEXT NOT NULL,
+        food_category TEXT NOT NULL,
+        quantity INTEGER NOT NULL,
+        status INTEGER DEFAULT 0 CHECK(status IN (0, 1, 2)),
+        completed_at TIMESTAMP,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (distributor_id) REFERENCES users(id)
+    );
+    INSERT INTO deliveries_new
+        (id, distributor_id, origin_location, destination_location,
+         food_category, quantity, status, completed_at, timestamp)
+        SELECT id, distributor_id, origin_location, destination_location,
+               food_category, quantity,
+               CASE status WHEN 'pending' THEN 0 WHEN 'in_transit' THEN 1 ELSE 2 END,
+               completed_at, timestamp
+        FROM deliveries;
+    DROP TABLE deliveries;
+    ALTER TABLE deliveries_new RENAME TO deliveries;
+    CREATE INDEX IF NOT EXISTS idx_deliveries_status
+        ON deliveries(status, timestamp DESC);
+    CREATE INDEX IF NOT EXISTS idx_deliveries_distributor
+        ON deliveries(distributor_id);
+    """)
+
+
+def _ensure_metrics_rollup(conn):
+    """Create and backfill the trigger-maintained metrics rollup.
+
+    get_regional_metrics re-aggregated supply_reports on every call.
+    The rollup keeps daily (region, food_category) supply buckets and a
+    (region, user_id) set, both maintained by an AFTER INSERT trigger,
+    so the dashboard read touches O(categories x 7) bucket rows and one
+    small count instead of the whole region partition. Buckets older
+    than the 7-day window are purged on startup.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'region_metrics'"
+    ).fetchone()
+    if exists:
+        conn.execute("DELETE FROM region_metrics WHERE day <= date('now', '-8 days')")
+        conn.commit()
+        return
+
+    conn.executescript("""
+    CREATE TABLE region_metrics (
+        region TEXT NOT NULL,
+        food_category TEXT NOT NULL,
+        day TEXT NOT NULL,
+        total_supply INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (region, food_category, day)
+    ) WITHOUT ROWID;
+    CREATE TABLE region_farmers (
+        region TEXT NOT NULL,
+        user_id INTEGER NOT NULL,
+        PRIMARY KEY (region, user_id)
+    ) WITHOUT ROWID;
+    CREATE TRIGGER trg_supply_metrics AFTER INSERT ON supply_reports BEGIN
+        INSERT INTO region_metrics (region, food_category, day, total_supply)
+        VALUES (NEW.region, NEW.food_category, date(NEW.timestamp), NEW.supply_units)
+        ON CONFLICT(region, food_category, day)
+        DO UPDATE SET total_supply = total_supply + excluded.total_supply;
+        INSERT OR IGNORE INTO region_farmers (region, user_id)
+        VALUES (NEW.region, NEW.user_id);
+    END;
+    INSERT INTO region_metrics (region, food_category, day, total_supply)
+        SELECT region, food_category, date(timestamp), SUM(supply_units)
+        FROM supply_reports
+        GROUP BY region, food_category, date(timestamp);
+    INSERT OR IGNORE INTO region_farmers (region, user_id)
+        SELECT DISTINCT region, user_id FROM supply_reports;
+    """)
+
+
 def init_db():
     """Initialize SQLite database if it doesn't exist"""
     if DB_PATH.exists():
+        if not _indexes_ensured:
+            # Databases created before the indexes existed still get
+            # them, and the (persistent) WAL switch below also upgrades
+            # pre-WAL files
+            conn = _connect()
+            _set_journal_mode(conn)
+            _ensure_waste_schema(conn)
+            _ensure_delivery_schema(conn)
+            _ensure_metrics_rollup(conn)
+            _ensure_indexes(conn)
+            conn.close()
         return
-    
-    conn = sqlite3.connect(DB_PATH)
+
+    conn = _connect()
+    _set_journal_mode(conn)
     cursor = conn.cursor()
     
     # Users table
@@ -62,7 +393,7 @@ def init_db():
         waste_type TEXT NOT NULL,
         quantity_kg REAL NOT NULL,
         processing_method TEXT,
-        energy_credits REAL DEFAULT 0,
+        energy_credits REAL GENERATED ALWAYS AS (quantity_kg * 0.5) STORED,
         timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         FOREIGN KEY (user_id) REFERENCES users(id)
     )
@@ -77,7 +408,7 @@ def init_db():
         destination_location TEXT NOT NULL,
         food_category TEXT NOT NULL,
         quantity INTEGER NOT NULL,
-        status TEXT DEFAULT 'pending',
+        status INTEGER DEFAULT 0 CHECK(status IN (0, 1, 2)),
         completed_at TIMESTAMP,
         timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         FOREIGN KEY (distributor_id) REFERENCES users(id)
@@ -85,9 +416,21 @@ def init_db():
     """)
     
     conn.commit()
+    _ensure_metrics_rollup(conn)
+    _ensure_indexes(conn)
     conn.close()
 
 
+# One-shot initialization at import: every function used to call
+# init_db() first, costing a stat() syscall per query even on the fast
+# path. Guarded so importing the module on a read-only filesystem (e.g.
+# tooling, docs builds) still works - the first write would fail anyway.
+try:
+    init_db()
+except (OSError, sqlite3.OperationalError):
+    pass
+
+
 def register_user(
     phone: str,
     name: str,
@@ -110,126 +453,213 @@ def register_user(
     Returns:
         User record with id
     """
-    init_db()
-    
+    conn = _get_conn()
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
-        
-        # Insert user
-        cursor.execute("""
+
+        # Single-statement registration: ON CONFLICT DO NOTHING turns the
+        # duplicate-phone case into a fetchone() branch instead of an
+        # IntegrityError, and RETURNING hands back the fresh row without
+        # a follow-up SELECT
+        cursor.execute(f"""
         INSERT INTO users (phone, name, email, national_id, location, role)
         VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(phone) DO NOTHING
+        RETURNING {_SQL_USER_COLS}
         """, (phone, name, email, national_id, location, role))
-        
-        user_id = cursor.lastrowid
+
+        row = cursor.fetchone()
         conn.commit()
-        
-        # Fetch and return user record
-        cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        user = dict(cursor.fetchone())
-        
-        conn.close()
-        
+        if row is None:
+            return {
+                "success": False,
+                "message": "Phone number already registered"
+            }
+
+        user = dict(row)
+
         return {
             "success": True,
             "user": user,
             "message": f"User {name} registered successfully as {role}"
         }
-    
-    except sqlite3.IntegrityError:
+
+    except Exception as e:
+        conn.rollback()
         return {
             "success": False,
-            "message": "Phone number already registered"
+            "message": f"Registration error: {str(e)}"
+        }
+
+
+def register_users_many(rows: List[tuple]) -> Dict:
+    """Bulk-register users in one transaction.
+
+    rows: (phone, name, email, national_id, location, role) tuples.
+    One executemany under a single commit amortizes the fsync across
+    the whole batch instead of paying it per user; already-registered
+    phones are skipped (INSERT OR IGNORE) and reported back.
+    """
+    conn = _get_conn()
+    try:
+        cursor = conn.cursor()
+        # Identify duplicates up front - after the insert every phone
+        # exists, so this is the only moment they're distinguishable
+        phones = [row[0] for row in rows]
+        placeholders = ",".join("?" * len(phones))
+        cursor.execute(
+            f"SELECT phone FROM users WHERE phone IN ({placeholders})", phones
+        )
+        duplicates = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany("""
+        INSERT OR IGNORE INTO users (phone, name, email, national_id, location, role)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """, rows)
+        conn.commit()
+
+        return {
+            "success": True,
+            "registered": len(rows) - len(duplicates),
+            "duplicates": duplicates,
+            "message": f"Registered {len(rows) - len(duplicates)} users "
+                       f"({len(duplicates)} duplicate phones skipped)"
         }
     except Exception as e:
+        conn.rollback()
         return {
             "success": False,
-            "message": f"Registration error: {str(e)}"
+            "message": f"Bulk registration error: {str(e)}"
+        }
+
+
+def record_supplies_many(rows: List[tuple]) -> Dict:
+    """Bulk-insert supply reports in one transaction.
+
+    rows: (user_id, region, food_category, supply_units) tuples. The
+    inserts and the matching +10 point awards share a single commit.
+    """
+    conn = _get_conn()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany("""
+        INSERT INTO supply_reports (user_id, region, food_category, supply_units)
+        VALUES (?, ?, ?, ?)
+        """, rows)
+        cursor.executemany(_SQL_ADD_POINTS, [(10, row[0]) for row in rows])
+        conn.commit()
+
+        return {
+            "success": True,
+            "recorded": len(rows),
+            "message": f"Recorded {len(rows)} supply reports"
+        }
+    except Exception as e:
+        conn.rollback()
+        return {
+            "success": False,
+            "message": f"Bulk supply error: {str(e)}"
         }
 
 
 def get_user_by_phone(phone: str) -> Optional[Dict]:
     """Get user by phone number"""
-    init_db()
-    
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT * FROM users WHERE phone = ? AND is_active = 1", (phone,))
+    aconn = _get_apsw_conn()
+    if aconn is not None:
+        for row in aconn.cursor().execute(_SQL_GET_USER_BY_PHONE, (phone,)):
+            return dict(zip(_USER_KEYS, row))
+        return None
+
+    cursor = _point_cursor()
+    cursor.execute(_SQL_GET_USER_BY_PHONE, (phone,))
     user = cursor.fetchone()
-    conn.close()
-    
+
     return dict(user) if user else None
 
 
 def get_user_by_id(user_id: int) -> Optional[Dict]:
     """Get user by ID"""
-    init_db()
-    
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT * FROM users WHERE id = ? AND is_active = 1", (user_id,))
+    aconn = _get_apsw_conn()
+    if aconn is not None:
+        for row in aconn.cursor().execute(_SQL_GET_USER_BY_ID, (user_id,)):
+            return dict(zip(_USER_KEYS, row))
+        return None
+
+    cursor = _point_cursor()
+    cursor.execute(_SQL_GET_USER_BY_ID, (user_id,))
     user = cursor.fetchone()
-    conn.close()
-    
+
     return dict(user) if user else None
 
 
-def get_users_by_role(role: str) -> List[Dict]:
-    """Get all users with a specific role"""
-    init_db()
-    
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+def get_users_by_role(role: str, limit: int = 50, offset: int = 0) -> List[Dict]:
+    """Get users with a specific role (paged, indexed lookup)"""
+    conn = _get_conn()
     cursor = conn.cursor()
-    
-    cursor.execute("SELECT * FROM users WHERE role = ? AND is_active = 1", (role,))
-    users = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    
+
+    cursor.execute(
+        f"SELECT {_SQL_USER_COLS} FROM users WHERE role = ? AND is_active = 1 "
+        "ORDER BY id LIMIT ? OFFSET ?",
+        (role, limit, offset)
+    )
+    users = _rows_to_dicts(cursor)
+
     return users
 
 
-def get_users_by_location(location: str) -> List[Dict]:
-    """Get all users in a specific location"""
-    init_db()
-    
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+def count_users_by_role(role: str) -> int:
+    """Count active users with a role without transferring the rows"""
+    conn = _get_conn()
     cursor = conn.cursor()
-    
-    cursor.execute("SELECT * FROM users WHERE location = ? AND is_active = 1", (location,))
-    users = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    
+    cursor.execute("SELECT COUNT(*) FROM users WHERE role = ? AND is_active = 1", (role,))
+    count = cursor.fetchone()[0]
+
+    return count
+
+
+def get_users_by_location(location: str, limit: int = 50, offset: int = 0) -> List[Dict]:
+    """Get users in a specific location (paged, indexed lookup)"""
+    conn = _get_conn()
+    cursor = conn.cursor()
+
+    cursor.execute(
+        f"SELECT {_SQL_USER_COLS} FROM users WHERE location = ? AND is_active = 1 "
+        "ORDER BY id LIMIT ? OFFSET ?",
+        (location, limit, offset)
+    )
+    users = _rows_to_dicts(cursor)
+
     return users
 
 
+def count_users_by_location(location: str) -> int:
+    """Count active users in a location without transferring the rows"""
+    conn = _get_conn()
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM users WHERE location = ? AND is_active = 1", (location,))
+    count = cursor.fetchone()[0]
+
+    return count
+
+
 def add_points(user_id: int, points: int, reason: str) -> Dict:
     """Award points to a user"""
-    init_db()
-    
+    conn = _get_conn()
     try:
-        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         
-        cursor.execute("""
-        UPDATE users SET points = points + ? WHERE id = ?
-        """, (points, user_id))
+        cursor.execute(_SQL_ADD_POINTS, (points, user_id))
         
         conn.commit()
-        conn.close()
         
         return {
             "success": True,
             "message": f"Awarded {points} points for {reason}"
         }
     except Exception as e:
+        conn.rollback()
         return {
             "success": False,
             "message": f"Error awarding points: {str(e)}"
@@ -238,28 +668,74 @@ def add_points(user_id: int, points: int, reason: str) -> Dict:
 
 def record_supply(user_id: int, region: str, food_category: str, supply_units: int) -> Dict:
     """Record supply report from farmer"""
-    init_db()
-    
+    conn = _get_conn()
     try:
-        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         
         cursor.execute("""
         INSERT INTO supply_reports (user_id, region, food_category, supply_units)
         VALUES (?, ?, ?, ?)
         """, (user_id, region, food_category, supply_units))
-        
+
+        # Points ride in the same transaction: one commit (and one
+        # fsync) instead of the two separate ones add_points would cost
+        cursor.execute(_SQL_ADD_POINTS, (10, user_id))
         conn.commit()
-        conn.close()
-        
-        # Award points
-        add_points(user_id, 10, "supply_report")
-        
+
         return {
             "success": True,
             "message": "Supply recorded and points awarded"
         }
     except Exception as e:
+        conn.rollback()
+        return {
+            "success": False,
+            "message": f"Error recording supply: {str(e)}"
+        }
+
+
+def _apply_supply_op(cursor, phone: str, region: str, food_category: str, supply_units: int) -> Dict:
+    """Run one by-phone supply insert on an open cursor (no commit).
+
+    INSERT ... SELECT looks up the reporting user inside SQLite, so the
+    caller doesn't need a prior get_user_by_phone query; the role gate
+    rides along in the WHERE clause. On failure an `error` marker says
+    whether the user was missing ("not_found") or has the wrong role
+    ("forbidden") - only that path pays for a diagnostic lookup.
+    """
+    cursor.execute("""
+    INSERT INTO supply_reports (user_id, region, food_category, supply_units)
+    SELECT id, ?, ?, ? FROM users
+    WHERE phone = ? AND is_active = 1 AND role IN ('farmer', 'livestock_farmer')
+    """, (region, food_category, supply_units, phone))
+
+    if cursor.rowcount == 0:
+        cursor.execute(_SQL_USER_EXISTS, (phone,))
+        exists = cursor.fetchone() is not None
+        return {
+            "success": False,
+            "error": "forbidden" if exists else "not_found",
+            "message": ("Only farmers can submit supply reports"
+                        if exists else "User not found")
+        }
+
+    # Points ride in the same transaction as the insert
+    cursor.execute("UPDATE users SET points = points + 10 WHERE phone = ?", (phone,))
+    return {
+        "success": True,
+        "message": "Supply recorded and points awarded"
+    }
+
+
+def record_supply_by_phone(phone: str, region: str, food_category: str, supply_units: int) -> Dict:
+    """Record a supply report resolved by phone in one round-trip."""
+    conn = _get_conn()
+    try:
+        result = _apply_supply_op(conn.cursor(), phone, region, food_category, supply_units)
+        conn.commit()
+        return result
+    except Exception as e:
+        conn.rollback()
         return {
             "success": False,
             "message": f"Error recording supply: {str(e)}"
@@ -268,96 +744,281 @@ def record_supply(user_id: int, region: str, food_category: str, supply_units: i
 
 def get_supply_by_user(user_id: int) -> List[Dict]:
     """Get all supply reports from a user"""
-    init_db()
-    
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = _get_conn()
     cursor = conn.cursor()
     
     cursor.execute("""
-    SELECT * FROM supply_reports WHERE user_id = ? ORDER BY timestamp DESC
+    SELECT id, region, food_category, supply_units, timestamp
+    FROM supply_reports WHERE user_id = ? ORDER BY timestamp DESC
     """, (user_id,))
     
-    reports = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    reports = _rows_to_dicts(cursor)
     
     return reports
 
 
 def get_supply_by_region(region: str) -> List[Dict]:
     """Get all supply reports from a region"""
-    init_db()
-    
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = _get_conn()
     cursor = conn.cursor()
     
     cursor.execute("""
-    SELECT sr.*, u.name as farmer_name
+    SELECT sr.id, sr.user_id, sr.food_category, sr.supply_units,
+           sr.timestamp, u.name as farmer_name
     FROM supply_reports sr
     JOIN users u ON sr.user_id = u.id
     WHERE sr.region = ?
     ORDER BY sr.timestamp DESC
     """, (region,))
     
-    reports = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    reports = _rows_to_dicts(cursor)
     
     return reports
 
 
 def record_waste(user_id: int, waste_type: str, quantity_kg: float, processing_method: str) -> Dict:
     """Record waste processing (for circular economy participants)"""
-    init_db()
-    
+    conn = _get_conn()
     try:
-        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         
-        # Simple energy credit calculation
-        energy_credits = quantity_kg * 0.5  # 0.5 credits per kg
-        
+        # energy_credits comes from the schema's generated column
         cursor.execute("""
-        INSERT INTO waste_tracking (user_id, waste_type, quantity_kg, processing_method, energy_credits)
-        VALUES (?, ?, ?, ?, ?)
-        """, (user_id, waste_type, quantity_kg, processing_method, energy_credits))
-        
+        INSERT INTO waste_tracking (user_id, waste_type, quantity_kg, processing_method)
+        VALUES (?, ?, ?, ?) RETURNING energy_credits
+        """, (user_id, waste_type, quantity_kg, processing_method))
+        energy_credits = cursor.fetchone()[0]
+
+        # Points ride in the same transaction as the insert
+        cursor.execute(_SQL_ADD_POINTS, (20, user_id))
         conn.commit()
-        conn.close()
-        
-        # Award points
-        add_points(user_id, 20, "waste_processed")
-        
+
         return {
             "success": True,
             "energy_credits": energy_credits,
             "message": f"Waste recorded: {energy_credits} energy credits earned"
         }
     except Exception as e:
+        conn.rollback()
         return {
             "success": False,
             "message": f"Error recording waste: {str(e)}"
         }
 
 
-def get_waste_by_user(user_id: int) -> List[Dict]:
-    """Get waste records for a user"""
-    init_db()
-    
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+def count_supply_by_region(region: str) -> int:
+    """Count supply reports for a region without transferring rows"""
+    conn = _get_conn()
     cursor = conn.cursor()
-    
+    cursor.execute("SELECT COUNT(*) FROM supply_reports WHERE region = ?", (region,))
+    count = cursor.fetchone()[0]
+
+    return count
+
+
+def iter_supply_by_region(region: str):
+    """Yield a region's supply reports row by row (newest first).
+
+    Generator form of get_supply_by_region for streaming responses:
+    rows flow straight from the cursor instead of being materialized
+    into one list.
+    """
+    conn = _get_conn()
+    cursor = conn.cursor()
+    # Fetch rows from SQLite in blocks rather than one at a time
+    cursor.arraysize = 256
+
+    try:
+        cursor.execute("""
+        SELECT sr.id, sr.user_id, sr.food_category, sr.supply_units,
+               sr.timestamp, u.name as farmer_name
+        FROM supply_reports sr
+        JOIN users u ON sr.user_id = u.id
+        WHERE sr.region = ?
+        ORDER BY sr.timestamp DESC
+        """, (region,))
+
+        keys = [d[0] for d in cursor.description]
+        for row in cursor:
+            yield dict(zip(keys, row))
+    finally:
+        # Pooled connection stays open; release the cursor so an
+        # abandoned iteration doesn't pin its statement
+        cursor.close()
+
+
+def _apply_waste_op(cursor, phone: str, waste_type: str, quantity_kg: float, processing_method: str) -> Dict:
+    """Run one by-phone waste insert on an open cursor (no commit).
+
+    Same INSERT ... SELECT shape as _apply_supply_op, gated on the
+    circular_economy role.
+    """
+    # energy_credits is computed by the schema's generated column;
+    # RETURNING hands it back without a second query
     cursor.execute("""
-    SELECT * FROM waste_tracking WHERE user_id = ? ORDER BY timestamp DESC
-    """, (user_id,))
-    
-    records = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    
+    INSERT INTO waste_tracking (user_id, waste_type, quantity_kg, processing_method)
+    SELECT id, ?, ?, ? FROM users
+    WHERE phone = ? AND is_active = 1 AND role = 'circular_economy'
+    RETURNING energy_credits
+    """, (waste_type, quantity_kg, processing_method, phone))
+
+    returned = cursor.fetchone()
+    if returned is None:
+        cursor.execute(_SQL_USER_EXISTS, (phone,))
+        exists = cursor.fetchone() is not None
+        return {
+            "success": False,
+            "error": "forbidden" if exists else "not_found",
+            "message": ("Only circular economy participants can submit waste reports"
+                        if exists else "User not found")
+        }
+
+    energy_credits = returned[0]
+    cursor.execute("UPDATE users SET points = points + 20 WHERE phone = ?", (phone,))
+    return {
+        "success": True,
+        "energy_credits": energy_credits,
+        "message": f"Waste recorded: {energy_credits} energy credits earned"
+    }
+
+
+def record_waste_by_phone(phone: str, waste_type: str, quantity_kg: float, processing_method: str) -> Dict:
+    """Record waste processing resolved by phone in one round-trip."""
+    conn = _get_conn()
+    try:
+        result = _apply_waste_op(conn.cursor(), phone, waste_type, quantity_kg, processing_method)
+        conn.commit()
+        return result
+    except Exception as e:
+        conn.rollback()
+        return {
+            "success": False,
+            "message": f"Error recording waste: {str(e)}"
+        }
+
+
+def get_waste_by_user(user_id: int, limit: int = 50, offset: int = 0) -> List[Dict]:
+    """Get waste records for a user (paged, newest first)"""
+    conn = _get_conn()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+    SELECT id, waste_type, quantity_kg, processing_method, energy_credits,
+           timestamp
+    FROM waste_tracking WHERE user_id = ? ORDER BY timestamp DESC
+    LIMIT ? OFFSET ?
+    """, (user_id, limit, offset))
+
+    records = _rows_to_dicts(cursor)
+
     return records
 
 
+def get_waste_summary(user_id: int) -> Dict:
+    """Total waste kg, energy credits and report count for a user.
+
+    One aggregating query instead of fetching every row and summing
+    in Python.
+    """
+    conn = _get_conn()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+    SELECT COALESCE(SUM(quantity_kg), 0),
+           COALESCE(SUM(energy_credits), 0),
+           COUNT(*)
+    FROM waste_tracking
+    WHERE user_id = ?
+    """, (user_id,))
+
+    total_kg, total_credits, count = cursor.fetchone()
+
+    return {
+        "total_kg": total_kg,
+        "total_credits": total_credits,
+        "count": count
+    }
+
+
+def get_waste_summary_by_phone(phone: str) -> Optional[Dict]:
+    """Waste totals for a user resolved by phone in one joined query.
+
+    Returns None when the phone is unknown; otherwise the user id plus
+    aggregated totals, so callers can page the detail rows without a
+    separate user lookup.
+    """
+    conn = _get_conn()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+    SELECT u.id,
+           COALESCE(SUM(w.quantity_kg), 0),
+           COALESCE(SUM(w.energy_credits), 0),
+           COUNT(w.id)
+    FROM users u
+    LEFT JOIN waste_tracking w ON w.user_id = u.id
+    WHERE u.phone = ? AND u.is_active = 1
+    GROUP BY u.id
+    """, (phone,))
+
+    row = cursor.fetchone()
+
+    if row is None:
+        return None
+
+    user_id, total_kg, total_credits, count = row
+    return {
+        "user_id": user_id,
+        "total_kg": total_kg,
+        "total_credits": total_credits,
+        "count": count
+    }
+
+
+def create_delivery_by_phone(
+    phone: str,
+    origin: str,
+    destination: str,
+    food_category: str,
+    quantity: int
+) -> Dict:
+    """Create a delivery order resolved by phone in one round-trip."""
+    conn = _get_conn()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute("""
+        INSERT INTO deliveries (distributor_id, origin_location, destination_location, food_category, quantity)
+        SELECT id, ?, ?, ?, ? FROM users
+        WHERE phone = ? AND is_active = 1 AND role = 'distributor'
+        """, (origin, destination, food_category, quantity, phone))
+
+        if cursor.rowcount == 0:
+            cursor.execute(_SQL_USER_EXISTS, (phone,))
+            exists = cursor.fetchone() is not None
+            return {
+                "success": False,
+                "error": "forbidden" if exists else "not_found",
+                "message": ("Only distributors can create deliveries"
+                            if exists else "User not found")
+            }
+
+        delivery_id = cursor.lastrowid
+        conn.commit()
+
+        return {
+            "success": True,
+            "delivery_id": delivery_id,
+            "message": "Delivery order created"
+        }
+    except Exception as e:
+        conn.rollback()
+        return {
+            "success": False,
+            "message": f"Error creating delivery: {str(e)}"
+        }
+
+
 def create_delivery(
     distributor_id: int,
     origin: str,
@@ -366,10 +1027,8 @@ def create_delivery(
     quantity: int
 ) -> Dict:
     """Create a delivery order (distributor)"""
-    init_db()
-    
+    conn = _get_conn()
     try:
-        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -379,7 +1038,6 @@ def create_delivery(
         
         delivery_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         return {
             "success": True,
@@ -387,6 +1045,7 @@ def create_delivery(
             "message": "Delivery order created"
         }
     except Exception as e:
+        conn.rollback()
         return {
             "success": False,
             "message": f"Error creating delivery: {str(e)}"
@@ -395,32 +1054,30 @@ def create_delivery(
 
 def complete_delivery(delivery_id: int) -> Dict:
     """Mark a delivery as complete"""
-    init_db()
-    
+    conn = _get_conn()
     try:
-        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         
+        # RETURNING hands back the distributor in the same statement -
+        # no second B-tree descent for a row the UPDATE just touched
         cursor.execute("""
-        UPDATE deliveries SET status = 'completed', completed_at = CURRENT_TIMESTAMP WHERE id = ?
+        UPDATE deliveries SET status = 2, completed_at = CURRENT_TIMESTAMP
+        WHERE id = ? RETURNING distributor_id
         """, (delivery_id,))
-        
-        # Get distributor ID to award points
-        cursor.execute("SELECT distributor_id FROM deliveries WHERE id = ?", (delivery_id,))
         result = cursor.fetchone()
         distributor_id = result[0] if result else None
-        
-        conn.commit()
-        conn.close()
-        
+
+        # Status change and points share one commit
         if distributor_id:
-            add_points(distributor_id, 15, "delivery_complete")
-        
+            cursor.execute(_SQL_ADD_POINTS, (15, distributor_id))
+        conn.commit()
+
         return {
             "success": True,
             "message": "Delivery marked complete and points awarded"
         }
     except Exception as e:
+        conn.rollback()
         return {
             "success": False,
             "message": f"Error completing delivery: {str(e)}"
@@ -428,57 +1085,194 @@ def complete_delivery(delivery_id: int) -> Dict:
 
 
 def get_deliveries_by_status(status: str) -> List[Dict]:
-    """Get all deliveries with a specific status"""
-    init_db()
-    
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """Get all deliveries with a specific status (name, e.g. 'pending')"""
+    code = _DELIVERY_STATUS_CODES.get(status)
+    if code is None:
+        return []
+
+    conn = _get_conn()
     cursor = conn.cursor()
-    
+
     cursor.execute("""
-    SELECT d.*, u.name as distributor_name
+    SELECT d.id, d.origin_location, d.destination_location, d.food_category,
+           d.quantity, d.completed_at, d.timestamp,
+           u.name as distributor_name
     FROM deliveries d
     JOIN users u ON d.distributor_id = u.id
     WHERE d.status = ?
     ORDER BY d.timestamp DESC
-    """, (status,))
-    
-    deliveries = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    
+    """, (code,))
+
+    deliveries = _rows_to_dicts(cursor)
+    # Every row matched the filter, so the name is already known
+    for delivery in deliveries:
+        delivery["status"] = status
+
     return deliveries
 
 
+def count_deliveries_by_status(status: str) -> int:
+    """Count deliveries with a status without transferring rows"""
+    code = _DELIVERY_STATUS_CODES.get(status)
+    if code is None:
+        return 0
+
+    conn = _get_conn()
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM deliveries WHERE status = ?", (code,))
+    count = cursor.fetchone()[0]
+
+    return count
+
+
+def iter_deliveries_by_status(status: str):
+    """Yield deliveries with a status row by row (newest first)."""
+    code = _DELIVERY_STATUS_CODES.get(status)
+    if code is None:
+        return
+
+    conn = _get_conn()
+    cursor = conn.cursor()
+    cursor.arraysize = 256
+
+    try:
+        cursor.execute("""
+        SELECT d.id, d.origin_location, d.destination_location, d.food_category,
+               d.quantity, d.completed_at, d.timestamp,
+               u.name as distributor_name
+        FROM deliveries d
+        JOIN users u ON d.distributor_id = u.id
+        WHERE d.status = ?
+        ORDER BY d.timestamp DESC
+        """, (code,))
+
+        keys = [d[0] for d in cursor.description]
+        for row in cursor:
+            record = dict(zip(keys, row))
+            record["status"] = status
+            yield record
+    finally:
+        # Pooled connection stays open; release the cursor so an
+        # abandoned iteration doesn't pin its statement
+        cursor.close()
+
+
 def get_regional_metrics(region: str) -> Dict:
     """Get aggregated supply-demand metrics for a region"""
-    init_db()
-    
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = _get_conn()
     cursor = conn.cursor()
     
-    # Count farmers in region
-    cursor.execute("""
-    SELECT COUNT(DISTINCT user_id) as farmer_count
-    FROM supply_reports
-    WHERE region = ?
-    """, (region,))
-    farmer_count = cursor.fetchone()['farmer_count'] or 0
-    
-    # Get recent supply-demand ratio
+    # Reads come from the trigger-maintained rollup: a handful of daily
+    # buckets per category plus a small per-region farmer set, instead
+    # of re-aggregating the region's full report history (window is at
+    # day granularity, matching the bucket size)
     cursor.execute("""
-    SELECT food_category, SUM(supply_units) as total_supply
-    FROM supply_reports
-    WHERE region = ? AND timestamp > datetime('now', '-7 days')
+    SELECT food_category, SUM(total_supply)
+    FROM region_metrics
+    WHERE region = ? AND day > date('now', '-7 days')
     GROUP BY food_category
     """, (region,))
-    
-    supplies = {row['food_category']: row['total_supply'] for row in cursor.fetchall()}
-    
-    conn.close()
+    supplies = {row[0]: row[1] for row in cursor.fetchall()}
+
+    cursor.execute("SELECT COUNT(*) FROM region_farmers WHERE region = ?", (region,))
+    farmer_count = cursor.fetchone()[0]
+
     
     return {
         "region": region,
         "farmer_count": farmer_count,
         "supplies_by_category": supplies
     }
+
+
+def apply_write_batch(ops: List[tuple]) -> List[Dict]:
+    """Apply queued supply/waste writes in one transaction.
+
+    WAL SQLite peaks with grouped commits: N buffered writes share a
+    single fsync instead of paying one each. Each op is
+    ("supply", phone, region, food_category, supply_units) or
+    ("waste", phone, waste_type, quantity_kg, processing_method);
+    results line up with ops positionally and carry the same
+    success/error shape as the by-phone single-write functions.
+    """
+    results = []
+    conn = _get_conn()
+    cursor = conn.cursor()
+
+    try:
+        for op in ops:
+            if op[0] == "supply":
+                results.append(_apply_supply_op(cursor, *op[1:]))
+            else:  # waste
+                results.append(_apply_waste_op(cursor, *op[1:]))
+
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        results = [{
+            "success": False,
+            "message": f"Error applying write: {str(e)}"
+        } for _ in ops]
+
+    return results
+
+
+# ========== ASYNC FACADE ==========
+#
+# Async handlers await these instead of wrapping each call in
+# asyncio.to_thread themselves: the sqlite3 work runs off the event
+# loop, and if the backing store ever moves to an async-native driver
+# only this module changes. Naming follows the blockchain layer's
+# a-prefix convention (acalculate_price).
+#
+# DB work gets its own bounded executor rather than the loop's shared
+# default one: the worker count caps how many thread-local connections
+# exist (SQLite allows one writer anyway - the server's write batching
+# already funnels writes through a single drain task), and a burst of
+# slow queries can't starve the unrelated to_thread users elsewhere in
+# the app. Size is tunable via DB_THREADS.
+
+_DB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DB_THREADS", "0")) or min(8, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="users-db"
+)
+
+
+def _to_async(func):
+    """Async wrapper dispatching a sync DB function to the DB executor."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _DB_EXECUTOR, functools.partial(func, *args, **kwargs)
+        )
+    return wrapper
+
+
+aregister_user = _to_async(register_user)
+aregister_users_many = _to_async(register_users_many)
+aget_user_by_phone = _to_async(get_user_by_phone)
+aget_user_by_id = _to_async(get_user_by_id)
+aget_users_by_role = _to_async(get_users_by_role)
+acount_users_by_role = _to_async(count_users_by_role)
+aget_users_by_location = _to_async(get_users_by_location)
+acount_users_by_location = _to_async(count_users_by_location)
+aadd_points = _to_async(add_points)
+arecord_supply = _to_async(record_supply)
+arecord_supplies_many = _to_async(record_supplies_many)
+arecord_supply_by_phone = _to_async(record_supply_by_phone)
+aget_supply_by_user = _to_async(get_supply_by_user)
+aget_supply_by_region = _to_async(get_supply_by_region)
+acount_supply_by_region = _to_async(count_supply_by_region)
+arecord_waste = _to_async(record_waste)
+arecord_waste_by_phone = _to_async(record_waste_by_phone)
+aapply_write_batch = _to_async(apply_write_batch)
+aget_waste_by_user = _to_async(get_waste_by_user)
+aget_waste_summary = _to_async(get_waste_summary)
+aget_waste_summary_by_phone = _to_async(get_waste_summary_by_phone)
+acreate_delivery = _to_async(create_delivery)
+acreate_delivery_by_phone = _to_async(create_delivery_by_phone)
+acomplete_delivery = _to_async(complete_delivery)
+aget_deliveries_by_status = _to_async(get_deliveries_by_status)
+acount_deliveries_by_status = _to_async(count_deliveries_by_status)
+aget_regional_metrics = _to_async(get_regional_metrics)